@@ -1,9 +1,20 @@
+import functools
 from util.xbase import XAPIValidationFailed
 from typing import Any, Dict
 
 import logging
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=None)
+def resolve_type(type_name: str):
+    """
+    Resolves a MSG_FIELDS type name to the type, or tuple of types, to check a field value against.
+    Cached per type name, so validate() does not evaluate the same type expression for every field of every message.
+        :param type_name: Type name as given in MSG_FIELDS e.g. "str" or "(int, float, str, dict)"
+        :return: The type or tuple of types for use with isinstance()
+    """
+    return eval(type_name)
+
 class API():
 
     def __init__(self):
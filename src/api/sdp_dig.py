@@ -3,7 +3,7 @@ import re
 import datetime
 from datetime import timezone
 from typing import Any, Dict
-from api.api import API
+from api.api import API, resolve_type
 from ipc.message import Message, AppMessage, APIMessage
 from util.xbase import XBase, XStreamUnableToExtract, XStreamUnableToEncode, XAPIValidationFailed, XAPIUnsupportedVersion
 
@@ -165,7 +165,8 @@ class SDP_DIG(API):
             :raises XAPIValidationFailed: If the message fails validation
         """
 
-        logger.debug(f"Validating API message: {json.dumps(api_msg, indent=4)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Validating API message: {json.dumps(api_msg, indent=4)}")
 
         if 'api_version' not in api_msg:
             raise XAPIValidationFailed("Message missing required field 'api_version'")
@@ -207,7 +208,7 @@ class SDP_DIG(API):
                 elif isinstance(MSG_FIELDS[field], dict):
                     if 'type' in MSG_FIELDS[field]:
                         expected_type = MSG_FIELDS[field]['type']
-                        if not isinstance(value, eval(expected_type)):
+                        if not isinstance(value, resolve_type(expected_type)):
                             raise XAPIValidationFailed(f"Invalid type for field '{field}': expected {expected_type}, got {type(value).__name__}")
                         # Check pattern if present
                         if 'pattern' in MSG_FIELDS[field]:
@@ -220,7 +221,7 @@ class SDP_DIG(API):
                         if not isinstance(value, dict):
                                 raise XAPIValidationFailed(f"Invalid type for field '{field}': expected dict, got {type(value).__name__}")
                         for k, v in value.items():
-                            if not isinstance(v, eval(value_type)):
+                            if not isinstance(v, resolve_type(value_type)):
                                 raise XAPIValidationFailed(f"Invalid type for value in field '{field}': expected {value_type}, got {type(v).__name__}")
                             # Validate each value against the schema
                             for schema_field, schema_rules in value_schema.items():
@@ -229,7 +230,7 @@ class SDP_DIG(API):
                                 schema_value = v[schema_field]
                                 if 'type' in schema_rules:
                                     expected_schema_type = schema_rules['type']
-                                    if not isinstance(schema_value, eval(expected_schema_type)):
+                                    if not isinstance(schema_value, resolve_type(expected_schema_type)):
                                         raise XAPIValidationFailed(f"Invalid type for sub-field '{schema_field}' in field '{field}': expected {expected_schema_type}, got {type(schema_value).__name__}")
                                     if 'pattern' in schema_rules:
                                         if not re.fullmatch(schema_rules['pattern'], str(schema_value)):
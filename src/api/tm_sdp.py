@@ -3,7 +3,7 @@ import re
 import datetime
 from datetime import timezone
 from typing import Any, Dict
-from api.api import API
+from api.api import API, resolve_type
 from ipc.message import Message, AppMessage, APIMessage
 from util.xbase import XBase, XStreamUnableToExtract, XStreamUnableToEncode, XAPIValidationFailed, XAPIUnsupportedVersion
 
@@ -158,7 +158,8 @@ class TM_SDP(API):
             :raises XAPIValidationFailed: If the message fails validation
         """
 
-        logger.debug(f"Validating API message: {json.dumps(api_msg, indent=4)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Validating API message: {json.dumps(api_msg, indent=4)}")
 
         if 'api_version' not in api_msg:
             raise XAPIValidationFailed("Message missing required field 'api_version'")
@@ -203,7 +204,7 @@ class TM_SDP(API):
                 elif isinstance(MSG_FIELDS[field], dict):
                     if 'type' in MSG_FIELDS[field]:
                         expected_type = MSG_FIELDS[field]['type']
-                        if not isinstance(value, eval(expected_type)):
+                        if not isinstance(value, resolve_type(expected_type)):
                             raise XAPIValidationFailed(f"Invalid type for field '{field}': expected {expected_type}, got {type(value).__name__}")
                         # Check pattern if present
                         if 'pattern' in MSG_FIELDS[field]:
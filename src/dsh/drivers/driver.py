@@ -6,7 +6,6 @@ import astropy.units as u
 from datetime import datetime, timezone
 import logging
 import numpy as np
-from typing import Tuple
 import threading
 
 from models.dsh import DishModel, DriverType, PointingState, Capability, DishMode, Feed, PECModel
@@ -92,7 +91,7 @@ class DishDriver:
         with self._rlock:
             return self._get_rotation_speed()
 
-    def get_min_max_alt(self) -> Tuple[float, float]:
+    def get_min_max_alt(self) -> tuple[float, float]:
         """ Get the minimum and maximum altitude limits of the dish from the subclass implementation.
             :return: A tuple of (min_altitude, max_altitude) in degrees.
         """
@@ -114,7 +113,7 @@ class DishDriver:
         """
         return self.dsh_model.tgt_id, self.dsh_model.target
 
-    def get_stow_altaz(self) -> Tuple[float, float]:
+    def get_stow_altaz(self) -> tuple[float, float]:
         """ Get the stow Alt Az position of the dish from the subclass implementation.
             :return: The stow Alt Az position as a tuple of (altitude, azimuth).
         """
@@ -174,7 +173,7 @@ class DishDriver:
         altaz = AltAz(obstime=now, location=self.location, alt=alt*u.deg, az=az*u.deg)
         return altaz
 
-    def get_current_pec(self) -> Tuple[float, float]:
+    def get_current_pec(self) -> tuple[float, float]:
         """ Get the current periodic error correction (PEC) for the dish.
             Calculated as the difference between the current pointing AltAz and the desired AltAz.
             :return: The current PEC as a tuple of (altitude PEC, azimuth PEC) in degrees.
@@ -200,7 +199,7 @@ class DishDriver:
 
         return alt_pec, az_pec
 
-    def get_rms_pec(self) -> Tuple[float, float]:
+    def get_rms_pec(self) -> tuple[float, float]:
         """ Calculate the RMS of the PEC history for altitude and azimuth.
             :return: A tuple of (altitude PEC RMS, azimuth PEC RMS) in degrees.
         """
@@ -668,16 +667,9 @@ class DishDriver:
             Track the drivers current target if states and modes permit. Delegates to subclass implementation.
             :raises NotImplementedError: If the method is not implemented by a subclass
         """
-        def _is_track_cmd_allowed(self) -> bool:
-            
-            if self.dsh_model.mode != DishMode.OPERATE:
-                return False
-            if self.dsh_model.pointing_state not in [PointingState.TRACK, PointingState.READY]:
-                return False
-            return True
-       
         # Check if track command is allowed
-        if not _is_track_cmd_allowed(self):
+        if self.dsh_model.mode != DishMode.OPERATE or \
+            self.dsh_model.pointing_state not in (PointingState.TRACK, PointingState.READY):
             raise XInvalidTransition(f"DishDriver {self.dsh_model.dsh_id} track command not allowed in dish mode or pointing state.\n{self.dsh_model.to_dict()}")
 
         # Calculate the desired AltAz for the current target
@@ -718,16 +710,9 @@ class DishDriver:
             Scan the drivers current target if states and modes permit. Delegates to subclass implementation.
             :raises NotImplementedError: If the method is not implemented by a subclass
         """
-        def _is_scan_cmd_allowed(self) -> bool:
-            
-            if self.dsh_model.mode != DishMode.OPERATE:
-                return False
-            if self.dsh_model.pointing_state not in [PointingState.SCAN, PointingState.READY]:
-                return False
-            return True
-       
         # Check if scan command is allowed
-        if not _is_scan_cmd_allowed(self):
+        if self.dsh_model.mode != DishMode.OPERATE or \
+            self.dsh_model.pointing_state not in (PointingState.SCAN, PointingState.READY):
             raise XInvalidTransition(f"DishDriver {self.dsh_model.dsh_id} scan command not allowed in dish mode or pointing state.\n{self.dsh_model.to_dict()}")
 
         # Calculate the desired AltAz for the current target
@@ -792,16 +777,8 @@ class DishDriver:
         """ Slew to the target AltAz position if states and modes permit. Delegates to subclass implementation.
             :param altaz: Target AltAz position
         """
-        def _is_slew_cmd_allowed(self) -> bool:
-
-            if self.dsh_model.mode != DishMode.OPERATE:
-                return False
-            if self.dsh_model.pointing_state != PointingState.READY:
-                return False
-            return True
-
         # Check if slew command is allowed
-        if not _is_slew_cmd_allowed(self):
+        if self.dsh_model.mode != DishMode.OPERATE or self.dsh_model.pointing_state != PointingState.READY:
             raise XInvalidTransition(f"DishDriver {self.dsh_model.dsh_id} slew command not allowed in dish mode or pointing state.\n{self.dsh_model.to_dict()}")
 
         # Update the desired AltAz in the dish model
@@ -1054,7 +1031,7 @@ class DishDriver:
         """
         raise NotImplementedError("Subclasses should implement this method.")
 
-    def _get_min_max_alt(self) -> Tuple[float, float]:
+    def _get_min_max_alt(self) -> tuple[float, float]:
         """ Get the minimum and maximum altitude limits of the dish from the subclass implementation.
             :return: A tuple of (min_altitude, max_altitude) in degrees.
         """
@@ -1066,7 +1043,7 @@ class DishDriver:
         """
         raise NotImplementedError("Subclasses should implement this method.")
 
-    def _get_stow_altaz(self) -> Tuple[float, float]:
+    def _get_stow_altaz(self) -> tuple[float, float]:
         """ Get the stow Alt Az position of the dish from the subclass implementation.
             :return: The stow Alt Az position as a tuple of (altitude, azimuth).
         """
@@ -1,11 +1,8 @@
 
-from astropy.time import Time
 from datetime import datetime, timezone
 import logging
-import pytest
 import socket
 import time
-from typing import Tuple
 
 from dsh.drivers.driver import DishDriver
 from ipc.tcp_server import TCPServer
@@ -58,7 +55,7 @@ class MD01Driver(DishDriver):
         """
         return self.md01_config.rotation_speed
 
-    def _get_min_max_alt(self) -> Tuple[float, float]:
+    def _get_min_max_alt(self) -> tuple[float, float]:
         """ Get the minimum and maximum altitude limits of the dish from the MD01 configuration.
             :return: A tuple of (min_altitude, max_altitude) in degrees.
         """
@@ -70,7 +67,7 @@ class MD01Driver(DishDriver):
         """
         return self.md01_config.resolution
 
-    def _get_stow_altaz(self) -> Tuple[float, float]:
+    def _get_stow_altaz(self) -> tuple[float, float]:
         """ Get the stow Alt Az position of the dish from the MD01 configuration.
             :return: The stow Alt Az position as a tuple of (altitude, azimuth).
         """
@@ -284,7 +281,7 @@ class MD01Driver(DishDriver):
         logger.debug(f"MD01Driver for controller {self.md01_config.host} {self.md01_config.port} received response from MD01 controller:\n{md01_rsp}")
         return md01_rsp
 
-    def _get_md01_altaz(self) -> Tuple[float, float]:
+    def _get_md01_altaz(self) -> tuple[float, float]:
         """Returns the current altitude and azimuth of the dish as a tuple of decimal numbers [degrees]."""
 
         md01_cmd = MD01Msg()
@@ -462,6 +459,7 @@ if __name__ == "__main__":
 
     import astropy.units as u
     from astropy.coordinates import EarthLocation, AltAz, SkyCoord
+    from astropy.time import Time
 
     now = Time(datetime.now(timezone.utc))
     frame = AltAz(obstime=now, location=md01_driver.location)
@@ -1,3 +1,5 @@
+import struct
+
 from ipc.message import Message
 from util.xbase import XStreamUnableToExtract, XStreamUnableToEncode
 
@@ -36,6 +38,60 @@ Commands:
 
 """
 
+# Pre-compiled frame layouts: start byte, 10 byte position body, [command byte,] end byte
+_CMD_FRAME = struct.Struct('>B10sBB')   # 13 byte command packet
+_RSP_FRAME = struct.Struct('>B10sB')    # 12 byte response packet
+
+def _encode_pos(alt: float, az: float, ph: int, pv: int, digits: bytes) -> bytes:
+    """
+    Encode altitude and azimuth into the 10 byte MD-01 position body (H1-H4, PH, V1-V4, PV).
+
+    :param alt: Altitude in degrees
+    :param az: Azimuth in degrees
+    :param ph: Azimuth resolution in pulses per degree
+    :param pv: Elevation resolution in pulses per degree
+    :param digits: Digit to byte lookup table, MD01Msg._CMD_DIGITS or MD01Msg._RSP_DIGITS
+    :return: 10 byte position body
+    """
+    buf = bytearray(10)
+
+    # Azimuth digits H1-H4 followed by PH
+    h = int(ph * (360+az))
+    d3, h = divmod(h, 1000)
+    d2, h = divmod(h, 100)
+    d1, d0 = divmod(h, 10)
+    buf[0] = digits[d3]
+    buf[1] = digits[d2]
+    buf[2] = digits[d1]
+    buf[3] = digits[d0]
+    buf[4] = ph
+
+    # Elevation digits V1-V4 followed by PV
+    v = int(pv * (360+alt))
+    d3, v = divmod(v, 1000)
+    d2, v = divmod(v, 100)
+    d1, d0 = divmod(v, 10)
+    buf[5] = digits[d3]
+    buf[6] = digits[d2]
+    buf[7] = digits[d1]
+    buf[8] = digits[d0]
+    buf[9] = pv
+
+    return bytes(buf)
+
+def _decode_pos(data) -> tuple:
+    """
+    Decode altitude and azimuth from a 12 or 13 byte MD-01 packet.
+    Masking the low nibble strips the 0x30 ASCII prefix used in commands,
+    so command and response digits decode the same way.
+
+    :param data: cmd or rsp packet
+    :return: (alt, az) tuple in degrees
+    """
+    az = (data[1] & 0x0F) * 100 + (data[2] & 0x0F) * 10 + (data[3] & 0x0F) + (data[4] & 0x0F) / 10 - 360
+    alt = (data[6] & 0x0F) * 100 + (data[7] & 0x0F) * 10 + (data[8] & 0x0F) + (data[9] & 0x0F) / 10 - 360
+    return alt, az
+
 class MD01Msg(Message):
     """
     MD01 Protocol Message Class
@@ -44,6 +100,10 @@ class MD01Msg(Message):
     START_BYTE  = bytes([0x57])  # Start byte. This is always 0x57 ('W')
     END_BYTE    = bytes([0x20])  # End byte. This is always 0x20 (space)
 
+    _START      = 0x57           # Integer forms of START_BYTE / END_BYTE used when packing frames
+    _END        = 0x20
+    _DELIMS     = (_START << 8) | _END  # Start and end bytes combined, to validate both in one compare
+
     CMD_STOP    = bytes([0x0F])  # Stop command
     CMD_STATUS  = bytes([0x1F])  # Status command
     CMD_SET     = bytes([0x2F])  # Set position command
@@ -52,6 +112,11 @@ class MD01Msg(Message):
     CMD_RESET      = bytes([0xF8]) # Reset command (not in original spec, set alt/az to 0)
     CMD_CALIBRATE  = bytes([0xF9]) # Calibrate command (not in original spec, set alt/az to provided values)
 
+    _CMD_NAMES = {CMD_STOP: "STOP", CMD_STATUS: "STATUS", CMD_SET: "SET"}
+
+    _CMD_DIGITS = bytes(range(0x30, 0x3A))  # Command position digits are ASCII '0'-'9'
+    _RSP_DIGITS = bytes(range(0x00, 0x0A))  # Response position digits are raw values 0-9
+
     def __init__(self):
         """
         Initializes the MD01 message instance.
@@ -71,21 +136,12 @@ class MD01Msg(Message):
         self.cmd = cmd
 
     def get_cmd(self) -> str:
+        """
+        Returns the command description, or an empty string for a response.
+        """
         if self.cmd is None:
-            msg_type = "Response"
-            cmd_str = ""
-        else:
-            msg_type = "Command"
-            if self.cmd == self.CMD_STOP:
-                cmd_str = "STOP"
-            elif self.cmd == self.CMD_STATUS:
-                cmd_str = "STATUS"
-            elif self.cmd == self.CMD_SET:
-                cmd_str = "SET"
-            else:
-                cmd_str = "UNKNOWN"
-            cmd_str = f"Cmd: {cmd_str}"
-        return cmd_str
+            return ""
+        return f"Cmd: {self._CMD_NAMES.get(self.cmd, 'UNKNOWN')}"
 
     def set_position(self, alt: float, az: float):
         """
@@ -117,9 +173,9 @@ class MD01Msg(Message):
 
         # If cmd is not set, then pack a response message (12 bytes)
         if self.cmd is None:
-            self.msg_data = self.START_BYTE + self._encode_position() + self.END_BYTE
+            self.msg_data = _RSP_FRAME.pack(self._START, self._encode_position(), self._END)
         else: # Else pack a command message (13 bytes)
-            self.msg_data = self.START_BYTE + self._encode_position() + self.cmd + self.END_BYTE
+            self.msg_data = _CMD_FRAME.pack(self._START, self._encode_position(), self.cmd[0], self._END)
 
         self.msg_length = len(self.msg_data)
         return self.msg_data
@@ -136,6 +192,9 @@ class MD01Msg(Message):
         if self.msg_length not in [12,13]:
             raise XStreamUnableToExtract(f"MD01Msg cannot unpack data {data} with invalid length {self.msg_length}. Length must be 12 or 13 bytes.")
 
+        if ((data[0] << 8) | data[-1]) != self._DELIMS:
+            raise XStreamUnableToExtract(f"MD01Msg cannot unpack data {data} with invalid start/end bytes. Expected 0x{self._START:02X} ... 0x{self._END:02X}.")
+
         self.ph = data[5]
         self.pv = data[10]
         
@@ -153,26 +212,13 @@ class MD01Msg(Message):
         - Add 360 to normalize to positive range
         - H1-H4: Azimuth as 4 ASCII digits (hundreds, tens, ones, tenths)
         - V1-V4: Elevation as 4 ASCII digits (hundreds, tens, ones, tenths)
-        
+        - Commands carry the digits as ASCII (0x3d), responses as raw values (0x0d)
+
          :return: byte representation of position in MD01 format
         """
 
-        prefix = "0" if self.cmd is None else "3"
-
-        H = str(int(self.ph * (360+self.az)))
-        H1 = prefix+H[0]
-        H2 = prefix+H[1]
-        H3 = prefix+H[2]
-        H4 = prefix+H[3]
-        V = str(int(self.pv * (360+self.alt)))
-        V1 = prefix+V[0]
-        V2 = prefix+V[1]
-        V3 = prefix+V[2]
-        V4 = prefix+V[3]
-
-        pos_str = f"{H1}{H2}{H3}{H4}{self.ph:02X}{V1}{V2}{V3}{V4}{self.pv:02X}"
-
-        return bytes.fromhex(pos_str)
+        digits = self._RSP_DIGITS if self.cmd is None else self._CMD_DIGITS
+        return _encode_pos(self.alt, self.az, self.ph, self.pv, digits)
 
     def _decode_position(self, msg: bytes):
         """
@@ -185,41 +231,17 @@ class MD01Msg(Message):
             raise XStreamUnableToExtract(f"MD01Msg cannot decode position from message with invalid length {len(msg)}. Length must be at least 12 bytes.")
 
         # See _encode_position for encoding details and reverse the process here
-        factor = 30 if len(msg) == 13 else 0
-
-        ans = msg.hex()
-        H1 = float(ans[2:4]) - factor
-        H2 = float(ans[4:6]) - factor
-        H3 = float(ans[6:8]) - factor
-        H4 = float(ans[8:10]) - factor
-        V1 = float(ans[12:14]) - factor
-        V2 = float(ans[14:16]) - factor
-        V3 = float(ans[16:18]) - factor
-        V4 = float(ans[18:20]) - factor
-
-        # Calculate angles for AltAz
-        self.az = round(H1 * 100 + H2 * 10 + H3 + H4 / 10 -360,1)
-        self.alt = round(V1 * 100 + V2 * 10 + V3 + V4 / 10 -360,1)
+        alt, az = _decode_pos(msg)
+        self.az = round(az, 1)
+        self.alt = round(alt, 1)
 
     def __str__(self):
         """
         Returns a human-readable string representation of the md01 message
         """
 
-        if self.cmd is None:
-            msg_type = "Response"
-            cmd_str = ""
-        else:
-            msg_type = "Command"
-            if self.cmd == self.CMD_STOP:
-                cmd_str = "STOP"
-            elif self.cmd == self.CMD_STATUS:
-                cmd_str = "STATUS"
-            elif self.cmd == self.CMD_SET:
-                cmd_str = "SET"
-            else:
-                cmd_str = "UNKNOWN"
-            cmd_str = f"Cmd: {cmd_str}"
+        msg_type = "Response" if self.cmd is None else "Command"
+        cmd_str = self.get_cmd()
 
         return super().__str__() + \
             f"MD01 {msg_type} {cmd_str} (length={self.msg_length}): Alt {self.alt}, Az {self.az}\n"
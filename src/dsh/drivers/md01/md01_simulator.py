@@ -23,6 +23,7 @@ Commands:
 - 0x2F: Set position
 """
 
+import selectors
 import socket
 import logging
 import sys
@@ -55,17 +56,21 @@ class MD01Simulator:
         # Movement parameters
         self.is_moving = False
         self.slew_rate = 2.0  # degrees per second
+        self._move_event = threading.Event()  # Set when a SET command starts movement (or on shutdown)
         
         # Protocol constants
         self.START_BYTE = 0x57  # Start byte. This is always 0x57 ('W')
         self.END_BYTE = 0x20    # End byte. This is always 0x20 (space)
+        self.DELIMS = (self.START_BYTE << 8) | self.END_BYTE  # Start and end bytes combined for a single compare
 
         # Command (0x0F=stop, 0x1F=status, 0x2F=set)
         self.CMD_STOP = 0x0F    # Stop command
         self.CMD_STATUS = 0x1F  # Status command
         self.CMD_SET = 0x2F     # Set position command
-        
-        
+
+        # Last encoded response as ((alt, az), packet), replaced as one tuple so
+        # client threads never see a position paired with another's packet
+        self._cached_resp = (None, None)
         
     def _encode_position(self, alt: float, az: float) -> bytes:
         """
@@ -80,20 +85,21 @@ class MD01Simulator:
         :param az: Azimuth in degrees
         :return: 12-byte response packet
         """
+        pos, resp = self._cached_resp
+        if pos == (alt, az):
+            return resp
+
         PH = 10 # Pulses per degree, 0A in hex
         PV = 10 # Pulses per degree, 0A in hex
-        H = str(int(PH * (360+az)))
-        H1 = "0"+H[0]
-        H2 = "0"+H[1]
-        H3 = "0"+H[2]
-        H4 = "0"+H[3]
-        V = str(int(PV * (360+alt)))
-        V1 = "0"+V[0]
-        V2 = "0"+V[1]
-        V3 = "0"+V[2]
-        V4 = "0"+V[3]
-        msg = bytes.fromhex("57"+H1+H2+H3+H4+"0A"+V1+V2+V3+V4+"0A20")
-        
+        H = int(PH * (360+az))
+        V = int(PV * (360+alt))
+        msg = bytes((
+            self.START_BYTE,
+            H // 1000, H // 100 % 10, H // 10 % 10, H % 10, PH,
+            V // 1000, V // 100 % 10, V // 10 % 10, V % 10, PV,
+            self.END_BYTE))
+
+        self._cached_resp = ((alt, az), msg)
         return msg
     
     def _decode_position(self, cmd: bytes) -> tuple:
@@ -104,18 +110,9 @@ class MD01Simulator:
         :return: (alt, az) tuple in degrees
         """
 
-        ans = cmd.hex()
-        H1 = float(ans[2:4]) - 30
-        H2 = float(ans[4:6]) - 30
-        H3 = float(ans[6:8]) - 30
-        H4 = float(ans[8:10]) - 30
-        V1 = float(ans[12:14]) - 30
-        V2 = float(ans[14:16]) - 30
-        V3 = float(ans[16:18]) - 30
-        V4 = float(ans[18:20]) - 30
-        # Calculate angles for AltAz
-        az = H1 * 100 + H2 * 10 + H3 + H4 / 10 -360
-        alt = V1 * 100 + V2 * 10 + V3 + V4 / 10 -360
+        # Mask the low nibble of each digit byte to strip the 0x30 ASCII prefix
+        az = (cmd[1] & 0x0F) * 100 + (cmd[2] & 0x0F) * 10 + (cmd[3] & 0x0F) + (cmd[4] & 0x0F) / 10 - 360
+        alt = (cmd[6] & 0x0F) * 100 + (cmd[7] & 0x0F) * 10 + (cmd[8] & 0x0F) + (cmd[9] & 0x0F) / 10 - 360
 
         return alt, az
     
@@ -130,7 +127,7 @@ class MD01Simulator:
             logger.warning(f"Invalid command length: {len(cmd)} bytes")
             return self._encode_position(self.current_alt, self.current_az)
         
-        if cmd[0] != self.START_BYTE or cmd[12] != self.END_BYTE:
+        if ((cmd[0] << 8) | cmd[12]) != self.DELIMS:
             logger.warning("Invalid command format: wrong start/end bytes")
             return self._encode_position(self.current_alt, self.current_az)
         
@@ -151,6 +148,7 @@ class MD01Simulator:
             self.target_alt = target_alt
             self.target_az = target_az
             self.is_moving = True
+            self._move_event.set()
             
         else:
             logger.warning(f"Unknown command type: 0x{command_type:02X}")
@@ -160,45 +158,45 @@ class MD01Simulator:
     def _update_position(self):
         """Background thread to simulate rotator movement."""
         while self.running:
-            if self.is_moving:
-                # Calculate deltas
-                delta_alt = self.target_alt - self.current_alt
-                delta_az = self.target_az - self.current_az
-                
-                # Check if we're close enough
-                if abs(delta_alt) < 0.1 and abs(delta_az) < 0.1:
-                    self.current_alt = self.target_alt
-                    self.current_az = self.target_az
-                    self.is_moving = False
-                    logger.info(f"Reached target position: Alt={self.current_alt:.1f}°, Az={self.current_az:.1f}°")
-                else:
-                    # Move towards target at slew_rate
-                    dt = 0.1  # Update every 100ms
-                    max_move = self.slew_rate * dt
-                    
-                    # Move altitude
-                    if abs(delta_alt) > max_move:
-                        self.current_alt += max_move if delta_alt > 0 else -max_move
-                    else:
-                        self.current_alt = self.target_alt
-                    
-                    # Move azimuth
-                    if abs(delta_az) > max_move:
-                        self.current_az += max_move if delta_az > 0 else -max_move
-                    else:
-                        self.current_az = self.target_az
-                    
-                    logger.debug(f"Moving to target: Alt={self.current_alt:.1f}°, Az={self.current_az:.1f}°")
+            # Sleep until a SET command starts movement, rather than polling while idle
+            if not self.is_moving:
+                self._move_event.wait()
+                self._move_event.clear()
+                continue
+
+            # Calculate deltas
+            delta_alt = self.target_alt - self.current_alt
+            delta_az = self.target_az - self.current_az
             
+            # Check if we're close enough
+            if abs(delta_alt) < 0.1 and abs(delta_az) < 0.1:
+                self.current_alt = self.target_alt
+                self.current_az = self.target_az
+                self.is_moving = False
+                logger.info(f"Reached target position: Alt={self.current_alt:.1f}°, Az={self.current_az:.1f}°")
+            else:
+                # Move towards target at slew_rate
+                dt = 0.1  # Update every 100ms
+                max_move = self.slew_rate * dt
+                
+                # Step each axis towards its target, clamped to the maximum move per update
+                self.current_alt += max(-max_move, min(max_move, delta_alt))
+                self.current_az += max(-max_move, min(max_move, delta_az))
+                
+                logger.debug(f"Moving to target: Alt={self.current_alt:.1f}°, Az={self.current_az:.1f}°")
+        
             time.sleep(0.1)
     
-    def _handle_client(self, client_socket, address):
-        """Handle a single client connection."""
-        logger.info(f"Connection from {address}")
-        
+    def _handle_client(self, sel, client_socket, conn):
+        """Handle a read event on a client connection registered with the selector."""
         try:
-            # Receive command (13 bytes)
-            data = client_socket.recv(13)
+            # Receive command (13 bytes), TCP may deliver it in more than one segment
+            n = client_socket.recv_into(conn.view[conn.got:])
+            conn.got += n
+            if n and conn.got < 13:
+                return  # Wait for the rest of the command
+
+            data = bytes(conn.buf[:conn.got])
             
             if data:
                 logger.info(f"Received: {data.hex()}")
@@ -210,12 +208,14 @@ class MD01Simulator:
                 client_socket.send(response)
                 logger.info(f"Sent: {response.hex()}")
         
+        except BlockingIOError:
+            return  # Spurious wake-up, nothing to read yet
         except Exception as e:
-            logger.error(f"Error handling client {address}: {e}")
+            logger.error(f"Error handling client {conn.address}: {e}")
         
-        finally:
-            client_socket.close()
-            logger.debug(f"Connection closed: {address}")
+        sel.unregister(client_socket)
+        client_socket.close()
+        logger.debug(f"Connection closed: {conn.address}")
     
     def start(self):
         """Start the simulator server."""
@@ -225,6 +225,9 @@ class MD01Simulator:
         update_thread = threading.Thread(target=self._update_position, daemon=True)
         update_thread.start()
         
+        # Single selector loop serves all (short-lived) client connections
+        sel = selectors.DefaultSelector()
+
         # Create server socket
         server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
@@ -232,34 +235,51 @@ class MD01Simulator:
         try:
             server_socket.bind((self.host, self.port))
             server_socket.listen(5)
+            server_socket.setblocking(False)
+            sel.register(server_socket, selectors.EVENT_READ, data=None)
             logger.info(f"MD-01 Simulator listening on {self.host}:{self.port}")
             logger.info(f"Initial position: Alt={self.current_alt:.1f}°, Az={self.current_az:.1f}°")
             
             while self.running:
                 try:
-                    # Accept connection
-                    client_socket, address = server_socket.accept()
-                    
-                    # Handle client in separate thread
-                    client_thread = threading.Thread(
-                        target=self._handle_client,
-                        args=(client_socket, address),
-                        daemon=True
-                    )
-                    client_thread.start()
+                    # Time out periodically so a cleared running flag is noticed
+                    for key, _ in sel.select(timeout=1.0):
+
+                        if key.data is None:
+                            # Accept connection
+                            client_socket, address = server_socket.accept()
+                            client_socket.setblocking(False)
+                            logger.info(f"Connection from {address}")
+                            sel.register(client_socket, selectors.EVENT_READ, data=_ClientConn(address))
+                        else:
+                            self._handle_client(sel, key.fileobj, key.data)
                 
                 except KeyboardInterrupt:
                     logger.info("Shutting down simulator...")
                     break
+                except BlockingIOError:
+                    pass  # Connection went away before it could be accepted
                 except Exception as e:
                     logger.error(f"Server error: {e}")
         
         finally:
-            server_socket.close()
+            for key in list(sel.get_map().values()):
+                key.fileobj.close()
+            sel.close()
             self.running = False
+            self._move_event.set()  # Unblock the position update thread so it can exit
             logger.info("Simulator stopped")
 
 
+class _ClientConn:
+    """Receive state of a client connection served by the simulator's selector loop."""
+
+    def __init__(self, address):
+        self.address = address
+        self.buf = bytearray(13)
+        self.view = memoryview(self.buf)
+        self.got = 0
+
 if __name__ == "__main__":
     # Parse command-line arguments
     import argparse
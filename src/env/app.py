@@ -1,10 +1,10 @@
 import argparse
 import asyncio
+from collections import deque
 from datetime import datetime, timezone, timedelta
-from logging.handlers import TimedRotatingFileHandler
-import os
+from logging.handlers import TimedRotatingFileHandler, QueueHandler, QueueListener
 from pathlib import Path
-from queue import Queue, Empty
+from queue import SimpleQueue
 import time
 import threading
 
@@ -22,6 +22,7 @@ from util.timer import Timer, TimerManager
 from env import events
 from env.events import InitEvent, StatusUpdateEvent
 from env.processor import Processor
+from env.ring import Ring
 from env.app_processor import AppProcessor
 
 import logging
@@ -30,6 +31,10 @@ logger = logging.getLogger(__name__)
 class App:
 
     logs_dir = Path("./logs").expanduser()
+    processor_join_timeout = 5.0            # Seconds to wait for each processor to finish its current event on stop
+
+    _DEBUG_SEPARATOR = "-"*40 + "\n"        # Separator line used in debug info
+    _arg_parsers = None                     # App name -> argument parser shared by the instances of a class, see get_arg_parser()
 
     def __init__(self, app_name: str, app_model: AppModel):
 
@@ -40,32 +45,41 @@ class App:
         self.app_model.app_name = app_name
         self.app_model.app_running = True
         
-        self.queue = Queue()                     # Event queue for the application
+        self.queue = Ring()                     # Event queue for the application, unbounded like the queue.Queue it replaced
         self.status_update_event = events.StatusUpdateEvent()  # Reusable status update event
         
         self.interfaces = {}                    # Dictionary to hold registered App interfaces
         self.entity_connection_map = {}         # Map of entity IDs to client sockets for entity driving interfaces
 
-        self.arg_parser = argparse.ArgumentParser(description=self.app_model.app_name)
-        self.add_args(self.arg_parser)
-        self.app_model.arguments = vars(self.get_args())
+        self.arg_parser = self.get_arg_parser()
+        self._parsed_args = None                # Parsed command line arguments, see get_args()
+        args = self.get_args()
+        self.app_model.arguments = vars(args)
 
         # Set log level based on verbose argument
-        if self.get_args().verbose:
+        if args.verbose:
             logging.getLogger().setLevel(logging.DEBUG)
         else:
             logging.getLogger().setLevel(logging.INFO)
 
-        self.app_model.num_processors = max(1, self.get_args().num_processors)
+        self.app_model.num_processors = max(1, args.num_processors)
         self.processors = []                    # List to hold processor threads
+        self._priority_q = deque()              # Priority events shared by the processors, see put_priority_event()
 
         self.start_timer_manager()              # Ensure timer manager is started before any timers are created
 
         self.app_model.health = HealthState.UNKNOWN
-        self._last_heartbeat = None
+        self._last_heartbeat = None             # time.monotonic_ns() of the last heartbeat
         self._lock = threading.Lock()
+        self._status_thread = None              # Thread running the status loop, see start_status_thread()
+        self._status_wakeup = threading.Event() # Set by stop() to end the status loop's 30 s sleep early
+        self._avail_report_due = threading.Event()  # Set by the availability report timer, the status thread then runs the report
+        self._avail_report_at = None            # Top of the hour the next availability report is due, see schedule_availability_report()
+        self._avail_listener = None             # Writes queued availability records to file, see get_availability_logger()
+        self._avail_log_dir = Path(App.logs_dir).expanduser() / "availability"
         self.avail_logger = self.get_availability_logger()
         self.report_availability()
+        self.schedule_availability_report()     # Report availability again at the top of every hour
 
     def __del__(self):
         self.stop()
@@ -80,9 +94,13 @@ class App:
         self.app_model.last_update = datetime.now(timezone.utc)
 
     def get_args(self):
-        # Use parse_known_args to avoid pytest's extra CLI arguments causing failures
-        args, _ = self.arg_parser.parse_known_args()
-        return args
+        """Gets the parsed command line arguments. The command line is parsed once and the result cached.
+            : return: The argparse namespace of parsed arguments
+        """
+        if self._parsed_args is None:
+            # Use parse_known_args to avoid pytest's extra CLI arguments causing failures
+            self._parsed_args, _ = self.arg_parser.parse_known_args()
+        return self._parsed_args
 
     def get_queue(self):
         return self.queue
@@ -93,8 +111,26 @@ class App:
     def set_name(self, name: str):
         self.app_model.app_name = name
 
-    def get_arg_parser(self):
-        return self.arg_parser
+    def get_arg_parser(self) -> argparse.ArgumentParser:
+        """Gets the argument parser shared by all instances of this App class with the same app name,
+            building it on first use. Parsers are cached per class, since each subclass adds its own arguments
+            in add_args(), and per app name, since the name is the parser's --help description.
+            : return: The argument parser
+        """
+        cls = type(self)
+        arg_parsers = cls.__dict__.get("_arg_parsers")
+        if arg_parsers is None:
+            arg_parsers = cls._arg_parsers = {}
+
+        app_name = self.app_model.app_name
+        arg_parser = arg_parsers.get(app_name)
+
+        if arg_parser is None:
+            arg_parser = argparse.ArgumentParser(description=app_name)
+            self.add_args(arg_parser)
+            arg_parsers[app_name] = arg_parser
+
+        return arg_parser
 
     def get_last_err_msg(self) -> str:
         return self.app_model.last_err_msg
@@ -120,7 +156,6 @@ class App:
     def start(self):
         """Starts the application."""
 
-        self.queue.put(InitEvent(self.app_model.app_name))  # Start with an initialisation event
         self.start_processors()
         self.start_status_thread()
 
@@ -130,14 +165,10 @@ class App:
         
         while self.app_model.app_running:
             try:
-                logger.info(f"App {self.app_model.app_name} status thread checking status update event {self.status_update_event}")
+                logger.info("App %s status thread checking status update event %s", self.app_model.app_name, self.status_update_event)
                 
                 # Sends heartbeat to the availability logger (I'm alive!)
                 self.heartbeat()
-                # If we have just passed the hour mark, report app availability
-                now = datetime.now(timezone.utc)
-                if now.minute == 0 and now.second < 30:
-                    self.report_availability()
 
                 if self.status_update_event.is_update_pending():
                     if self.status_update_event.get_dequeued_count() == 0:
@@ -146,45 +177,57 @@ class App:
                         pass
                     else:
                         # An update is still pending, and we know initialisation has completed
-                        # (since the dequeued count is > 0), so alert the user
-                        ms_since_update_queued = self.status_update_event.get_millis_since_update_enqueued()
-
-                        debug_info = []
-                        debug_info.append("-"*40+"\n")
-                        debug_info.append(f"App {self.app_model.app_name} Debug Info\n")
-                        debug_info.append("-"*40+"\n")
-
-                        debug_info.append(f"Queue size is {self.queue.qsize()}\n")
-                        debug_info.append(f"Status update event has been pending for {ms_since_update_queued} ms\n")
-                        debug_info.append(f"Status update event dequeued count is {self.status_update_event.get_dequeued_count()}\n")
-                        debug_info.append(f"Status update event currently being processed {self.status_update_event.is_being_processed()}\n")
-                        debug_info.append(f"Number of processors: {len(self.processors)}\n")
-
-                        for processor in self.processors:
-
-                            debug_info.append(f"Processor {processor.name} current event: {processor.get_current_event()}\n")
-                            debug_info.append(f"Processor {processor.name} elapsed processing time: {processor.get_current_event_processing_time()} ms\n")
-
-                        debug_info.append("-"*40+"\n")
-
-                        logger.info(f"App {self.app_model.app_name} Debug Info:\n{''.join(debug_info)}")
+                        # (since the dequeued count is > 0), so alert the user if anyone is listening
+                        if logger.isEnabledFor(logging.INFO):
+                            name = self.app_model.app_name
+                            event = self.status_update_event
+
+                            processor_info = "".join(
+                                f"Processor {p.name} current event: {p.get_current_event()}\n"
+                                f"Processor {p.name} elapsed processing time: {p.get_current_event_processing_time()} ms\n"
+                                for p in self.processors)
+
+                            debug_info = (
+                                f"{App._DEBUG_SEPARATOR}"
+                                f"App {name} Debug Info\n"
+                                f"{App._DEBUG_SEPARATOR}"
+                                f"Queue size is {self.queue.qsize()}\n"
+                                f"Status update event has been pending for {event.get_millis_since_update_enqueued()} ms\n"
+                                f"Status update event dequeued count is {event.get_dequeued_count()}\n"
+                                f"Status update event currently being processed {event.is_being_processed()}\n"
+                                f"Number of processors: {len(self.processors)}\n"
+                                f"{processor_info}"
+                                f"{App._DEBUG_SEPARATOR}")
+
+                            logger.info("App %s Debug Info:\n%s", name, debug_info)
                 else:
-                    self.status_update_event.enqueue(self.queue)
-                    
-                time.sleep(30)  # Sleep briefly to avoid busy-waiting
+                    self.status_update_event.notify_enqueued()
+                    self.put_priority_event(self.status_update_event)
 
             except Exception as e:
                 logger.error(self.set_last_err(f"App {self.app_model.app_name} encountered an error: {e}"))
+
+            # Sleep until the next status check, unless stop() wakes us up first.
+            # Also sleep after an error, rather than retrying straight away in a tight loop.
+            # The availability report timer wakes us up too, run its report and sleep for the rest of the 30 s
+            next_check = time.monotonic() + 30
+            while self._status_wakeup.wait(max(0.0, next_check - time.monotonic())) and self.app_model.app_running:
+                self._status_wakeup.clear()
+                self._run_due_availability_report()
     
     def stop(self):
         """Stops the application."""
 
-        self.app_modelapp_running = False # Stops status thread
+        self.app_model.app_running = False      # Stops status thread
+        self.stop_status_thread()
         self.stop_timer_manager()
         self.stop_processors()
 
-        if not self.queue.empty():
-            self.queue.queue.clear()
+        self.queue.clear()                      # Processors have stopped, discard any events left behind
+
+        if self._avail_listener is not None:
+            self._avail_listener.stop()         # Flushes any queued availability records to file
+            self._avail_listener = None
 
         logger.info(f"App {self.app_model.app_name} stopped")
         self.app_model.health = HealthState.UNKNOWN
@@ -195,21 +238,60 @@ class App:
         for i in range(self.app_model.num_processors):
             processor = AppProcessor(name=f"{self.app_model.app_name}-Processor-{i+1}", event_q=self.queue, driver=self)
             self.processors.append(processor)
+
+        # Start with an initialisation event, on the first processor ahead of any events
+        # the interface endpoints have already queued
+        self.processors[0].put_priority(InitEvent(self.app_model.app_name))
+
+        # Processors share the event queue and the priority events, and steal events set aside by busy peers
+        for processor in self.processors:
+            processor.set_peers(self.processors)
+            processor.set_shared_priority(self._priority_q)
             processor.start()
 
+    def put_priority_event(self, event):
+        """Hands an event to the processors' shared priority deque, so the first free processor
+            processes it ahead of the events waiting in the event queue.
+            Falls back to the event queue if there are no processors.
+            : param event: The event to process
+        """
+        if not self.processors:
+            self.queue.put(event)
+            return
+
+        self._priority_q.append(event)
+        self.queue.notify()                     # Wake a processor sleeping on an empty queue
+
     def stop_processors(self):
-        """Stops all processor threads."""
+        """Stops all processor threads and waits for them to finish their current events."""
         Processor.stop_all()
+        self.queue.close()                      # Wake processors waiting on an empty queue so they see the stop
+
+        for processor in self.processors:
+            if processor.is_alive() and processor is not threading.current_thread():
+                processor.join(timeout=App.processor_join_timeout)
+
         self.processors = []
 
         self.app_model.health = HealthState.UNKNOWN
 
     def start_status_thread(self):
         """Starts a thread to periodically enqueue status update events."""
-        thread = threading.Thread(target=self.run, name=f"{self.app_model.app_name}-StatusThread", daemon=True)
-        thread.start()
+        self._status_wakeup.clear()             # A previous stop() may have left it set
+        self._status_thread = threading.Thread(target=self.run, name=f"{self.app_model.app_name}-StatusThread", daemon=True)
+        self._status_thread.start()
         logger.info(f"App {self.app_model.app_name} started status thread")
 
+    def stop_status_thread(self):
+        """Wakes the status thread so it sees app_running is False, and waits for it to exit."""
+        self._status_wakeup.set()
+
+        thread = self._status_thread
+        if thread is not None and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout=App.processor_join_timeout)
+
+        self._status_thread = None
+
     def start_timer_manager(self):
         """Starts the timer manager if not already running."""
         if Timer.manager is None:
@@ -247,15 +329,14 @@ class App:
         logger.info(f"App {self.app_model.app_name} registered interface for system '{system_name}' with API version {api.get_api_version()} at endpoint {endpoint}")
 
         self.interfaces[system_name] = (api, endpoint, interface_type)
-        self.app_model.interfaces.append(system_name)
+        self.app_model.interfaces = list(self.interfaces)   # Registration ordered list of system names
 
     def deregister_interface(self, system_name: str):
         """Deregisters an interface from the application.
             : param system_name: The name of the system the interface is for
         """
-        if system_name in self.interfaces:
-            self.app_model.interfaces.remove(system_name)
-            del self.interfaces[system_name]
+        if self.interfaces.pop(system_name, None) is not None:
+            self.app_model.interfaces = list(self.interfaces)
 
             logger.info(f"App {self.app_model.app_name} deregistered interface for system '{system_name}'")
         else:
@@ -266,10 +347,11 @@ class App:
             : param system_name: The name of the system the interface is for
             : return: The API, endpoint, and interface type if found, else None
         """
-        if system_name not in self.interfaces:
+        interface = self.interfaces.get(system_name)
+        if interface is None:
             raise XSoftwareFailure(self.set_last_err(f"App {self.app_model.app_name} has no registered interface for system '{system_name}'"))
 
-        return self.interfaces.get(system_name, None)
+        return interface
 
     def get_app_processor_state(self) -> dict:
         """Updates the app(lication) model with the current state of its processors.
@@ -277,27 +359,13 @@ class App:
         """
         processors = []
         for processor in self.processors:
-            # Get the current event and convert it to a JSON-serializable form.
-            ev = processor.get_current_event()
-            if ev is None:
-                ev_repr = None
-            else:
-                # Prefer a structured representation if the event exposes it,
-                # otherwise fall back to a short string.
-                try:
-                    if hasattr(ev, "to_dict") and callable(ev.to_dict):
-                        ev_repr = ev.to_dict()
-                    else:
-                        # Use a concise string representation to avoid embedding
-                        # large objects or types that aren't JSON serializable.
-                        ev_repr = str(ev)
-                except Exception:
-                    ev_repr = repr(ev)
+            # Snapshot the current event in a JSON-serializable form
+            ev_repr, processing_time_ms = processor.get_current_event_repr()
 
             proc_model = ProcessorModel(
                 name=processor.name,
                 current_event=ev_repr,
-                processing_time_ms=processor.get_current_event_processing_time()
+                processing_time_ms=processing_time_ms
             )
             processors.append(proc_model)
 
@@ -310,13 +378,18 @@ class App:
     def heartbeat(self):
         """Updates the last heartbeat timestamp to the current time."""
         with self._lock:
-            self._last_heartbeat = datetime.now(timezone.utc)
-            self.avail_logger.info("Heartbeat")
+            self._last_heartbeat = time.monotonic_ns()
+        self.avail_logger.info("Heartbeat")
 
     def set_health_state(self, health: HealthState):
         """Sets the health state of the application.
             : param health: The new health state
         """
+        # Most calls do not change the health state, so check without the lock first.
+        # The lock is only taken for a transition, to keep concurrent transitions (and their log records) in order
+        if self.app_model.health is health:
+            return
+
         with self._lock:
             old_health = self.app_model.health
             if old_health != health:
@@ -325,9 +398,12 @@ class App:
                 self.avail_logger.info(f"App {self.app_model.app_name} health state transition {old_health.name} -> {health.name}")
 
     def get_availability_logger(self) -> logging.Logger:
-        """Gets a dedicated logger for availability logging only."""
+        """Gets a dedicated logger for availability logging only.
+            Records are queued by the logger and written to file by a QueueListener thread,
+            so callers such as heartbeat() never block on disk I/O.
+        """
 
-        log_dir = Path(App.logs_dir).expanduser() / "availability"
+        log_dir = self._avail_log_dir
         log_dir.mkdir(parents=True, exist_ok=True)
 
         # Use a unique logger name for availability
@@ -336,7 +412,7 @@ class App:
         logger.setLevel(logging.INFO)
         logger.propagate = False  # Don't propagate to root logger
 
-        log_file = os.path.join(log_dir, f"{self.app_model.app_name}.log")
+        log_file = log_dir / f"{self.app_model.app_name}.log"
 
         # Remove all handlers to avoid duplicate logs if re-initialized
         logger.handlers.clear()
@@ -353,28 +429,87 @@ class App:
         formatter = logging.Formatter("%(asctime)s | %(levelname)s | %(message)s")
         handler.setFormatter(formatter)
 
-        logger.addHandler(handler)
+        if self._avail_listener is not None:
+            self._avail_listener.stop()
+
+        queue_handler = QueueHandler(SimpleQueue())
+        self._avail_listener = QueueListener(queue_handler.queue, handler)
+        self._avail_listener.start()
+
+        logger.addHandler(queue_handler)
 
         return logger
 
-    def report_availability(self):
-        """Reports the current availability metrics for the last hour."""
+    def schedule_availability_report(self):
+        """Starts a one-shot timer for the availability report at the top of the next hour.
+            The status thread re-arms the timer after each report, so the report runs once per hour.
+            The next hour is counted on from the previous report's hour rather than read off the clock,
+            so a timer that expires a few ms before the hour does not report the same hour twice.
+        """
+        now = datetime.now(timezone.utc)
+
+        report_at = self._avail_report_at
+        if report_at is None:
+            report_at = now.replace(minute=0, second=0, microsecond=0)
+
+        report_at += timedelta(hours=1)
+        while report_at <= now:                 # Skip the hours missed while e.g. the host was suspended
+            report_at += timedelta(hours=1)
+
+        self._avail_report_at = report_at
+        duration_ms = int((report_at - now).total_seconds() * 1000)
+
+        Timer(name=f"{self.app_model.app_name}_availability_report", event_q=self.queue,
+            duration_ms=duration_ms, user_callback=self._availability_report_timeout)
+
+    def _availability_report_timeout(self, user_ref=None):
+        """Timer callback that hands the hourly availability report to the status thread and wakes it up.
+            Parsing the availability logs can take a while, so it is kept off the AppProcessor threads.
+        """
+        self._avail_report_due.set()
+        self._status_wakeup.set()
+
+    def _run_due_availability_report(self):
+        """Runs the hourly availability report on the status thread if its timer has expired, and schedules
+            the next report. The next report is scheduled even if this one fails, so one bad log file does not
+            stop the hourly reports.
+        """
+        if not self._avail_report_due.is_set():
+            return
+
+        self._avail_report_due.clear()
+        try:
+            self.report_availability(end_period=self._avail_report_at)
+        except Exception as e:
+            logger.error(self.set_last_err(f"App {self.app_model.app_name} failed to report availability: {e}"))
+        finally:
+            self.schedule_availability_report()
+
+    def report_availability(self, end_period: datetime = None):
+        """Reports the availability metrics for the last hour.
+            : param end_period: End of the reporting period, defaults to now. The period starts at the top
+                of the hour before it, e.g. 09:00 for an hourly report due at 10:00
+        """
+
+        logs_dir = self._avail_log_dir
+        end_period = end_period if end_period is not None else datetime.now(timezone.utc)
+        start_period = end_period.replace(minute=0, second=0, microsecond=0) - timedelta(hours=1)
+
+        # Parse the availability logs without holding the lock, so heartbeat() and
+        # set_health_state() are not held up by the file I/O
+        availability = get_app_availability(
+            logs_dir, 
+            self.app_model.app_name, 
+            start_period, 
+            end_period)
+        
+        reliability = get_app_reliability(
+            logs_dir, 
+            self.app_model.app_name, 
+            start_period, 
+            end_period)
 
         with self._lock:
-            logs_dir = App.logs_dir / "availability"
-            end_period = datetime.now(timezone.utc)
-            start_period = end_period.replace(minute=0, second=0, microsecond=0) - timedelta(hours=1)
-            
-            self.app_model.availability = get_app_availability(
-                logs_dir, 
-                self.app_model.app_name, 
-                start_period, 
-                end_period)
-            
-            self.app_model.reliability = get_app_reliability(
-                logs_dir, 
-                self.app_model.app_name, 
-                start_period, 
-                end_period)
-             
+            self.app_model.availability = availability
+            self.app_model.reliability = reliability
             
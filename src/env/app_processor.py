@@ -1,6 +1,6 @@
 from env.processor import Processor
 from env.events import InitEvent, StatusUpdateEvent, ConfigEvent, ObsEvent
-from queue import Queue, Empty
+from queue import Queue, Empty, Full
 from datetime import datetime, timezone
 import time
 import json
@@ -19,11 +19,38 @@ logger = logging.getLogger(__name__)
 
 class AppProcessor(Processor):
 
+    # Debug set requests: (property name, value) -> (debug flag, logger level)
+    _DEBUG_OPS = {
+        ('set_debug', 'on'): (True, logging.DEBUG),
+        ('set_debug', 'off'): (False, logging.INFO),
+    }
+
     def __init__(self, name=None, event_q=None, driver=None):
         super().__init__(name=name, event_q=event_q)
         self.driver = driver
         self.debug = False
 
+        # API message reused to unpack every data event, see _on_data_event()
+        self._scratch_api_msg = APIMessage()
+
+        # Driver handlers by name, resolved once and bound to the driver, see _get_driver_handler()
+        self._driver_handlers = {}
+
+        # Driver's application name, resolved on first use and refreshed on init and config resync events
+        self._driver_app_name = None
+
+        # Event type -> handler dispatch table, see process_event()
+        self._dispatch = {
+            InitEvent: self._on_init_event,
+            StatusUpdateEvent: self._on_status_update_event,
+            events.TimerEvent: self._on_timer_event,
+            events.DataEvent: self._on_data_event,
+            events.ConnectEvent: self._on_connect_event,
+            events.DisconnectEvent: self._on_disconnect_event,
+            ConfigEvent: self._on_config_event,
+            ObsEvent: self._on_obs_event,
+        }
+
     def initialise_app(self):
 
         Processor.single_thread()
@@ -31,7 +58,8 @@ class AppProcessor(Processor):
         handler_method = "process_init"
 
         self.performActions(getattr(self.driver, handler_method)())
-        logger.debug(f"AppProcessor {self.name} initialised")
+        self._refresh_driver_snapshot()
+        logger.debug("AppProcessor %s initialised", self.name)
 
         Processor.free_thread()
 
@@ -39,10 +67,13 @@ class AppProcessor(Processor):
 
         Processor.single_thread()
 
+        self._driver_handlers.clear()  # The driver may change its handlers on a config resync
+
         handler_method = "process_config"
 
         self.performActions(getattr(self.driver, handler_method)(event))
-        logger.debug(f"AppProcessor {self.name} config resync'ed")
+        self._refresh_driver_snapshot()
+        logger.debug("AppProcessor %s config resync'ed", self.name)
 
         Processor.free_thread()
 
@@ -52,18 +83,45 @@ class AppProcessor(Processor):
             event.notify_dequeued()
 
             handler_method = "get_health_state"
-            if hasattr(self.driver, handler_method) and callable(getattr(self.driver, handler_method)):
-                self.driver.set_health_state(getattr(self.driver, handler_method)())
+            handler = self._get_driver_handler(handler_method)
+            if handler is not None:
+                self.driver.set_health_state(handler())
 
-            logger.debug(f"AppProcessor {self.name} health state is {self.driver.app_model.health.name}")
+            logger.debug("AppProcessor %s health state is %s", self.name, self.driver.app_model.health.name)
 
             handler_method = "process_status_event"
-            if hasattr(self.driver, handler_method) and callable(getattr(self.driver, handler_method)):
-                self.performActions(getattr(self.driver, handler_method)(event))
+            handler = self._get_driver_handler(handler_method)
+            if handler is not None:
+                self.performActions(handler(event))
 
         finally:
             event.notify_update_completed()
 
+    def _get_driver_handler(self, handler_method: str):
+        """Gets a driver handler by name. The bound handler (or its absence) is cached per processor,
+            so repeated events do not look it up on the driver again.
+            : param handler_method: The name of the handler e.g. process_dig_msg
+            : return: The bound handler method, or None if the driver has no callable handler by that name
+        """
+        try:
+            return self._driver_handlers[handler_method]
+        except KeyError:
+            handler = getattr(self.driver, handler_method, None)
+            handler = self._driver_handlers[handler_method] = handler if callable(handler) else None
+            return handler
+
+    def _refresh_driver_snapshot(self) -> str:
+        """Safely resolves the driver's application name and keeps it for the following data events.
+            : return: The driver's application name
+        """
+        if getattr(self.driver, "app_model", None) is not None and hasattr(self.driver.app_model, "app_name"):
+            self._driver_app_name = self.driver.app_model.app_name
+        else:
+            logger.error(self.driver.set_last_err(f"AppProcessor {self.name} driver has no app_model.app_name attribute"))
+            self._driver_app_name = getattr(self.driver, "app_name", None) or type(self.driver).__name__
+
+        return self._driver_app_name
+
     def _get_entity(self, event) -> (str, BaseModel):
         """Resolve the entity id from the event by calling the driver's get_<from_system>_entity handler.
             : param event: The event to extract the entity ID from
@@ -72,7 +130,7 @@ class AppProcessor(Processor):
         entity = (None, None)
 
         # Check if the event is a ConnectEvent, DisconnectEvent, or DataEvent
-        if isinstance(event, events.ConnectEvent) or isinstance(event, events.DisconnectEvent) or isinstance(event, events.DataEvent):
+        if isinstance(event, (events.ConnectEvent, events.DisconnectEvent, events.DataEvent)):
         
             api, endpoint, interface_type = self.driver.get_interface(event.local_sap.description)
 
@@ -81,14 +139,15 @@ class AppProcessor(Processor):
                 # Resolve the entity from the event using the driver's get_<from_system>_entity handler
                 handler_method = "get_" + event.local_sap.description + "_entity"
 
-                if hasattr(self.driver, handler_method) and callable(getattr(self.driver, handler_method)):
+                handler = self._get_driver_handler(handler_method)
+                if handler is not None:
                     try:
-                        entity = getattr(self.driver, handler_method)(event) # Expecting a tuple (entity_id, entity)
+                        entity = handler(event) # Expecting a tuple (entity_id, entity)
                     except Exception as e:
                         logger.exception(self.driver.set_last_err(f"AppProcessor {self.name} exception in driver handler {handler_method} while processing event {event}: {e}"))
                         return None, None
                 else:
-                    logger.warning(f"AppProcessor {self.name} driver has no handler to get entity ID from event {event}")
+                    logger.warning("AppProcessor %s driver has no handler to get entity ID from event %s", self.name, event)
                     return None, None
 
         return entity
@@ -113,225 +172,257 @@ class AppProcessor(Processor):
     
     def process_event(self, event) -> bool:
 
-        start_time = time.time()
-        st = datetime.fromtimestamp(start_time, tz=timezone.utc).isoformat()
-        
-        logger.debug(f"AppProcessor {self.name} started processing event {type(event)} at {st}")
+        # Only build the timestamps if they will be logged
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("AppProcessor %s started processing event %s at %s", self.name, type(event), datetime.now(timezone.utc).isoformat())
+
+        start_time = time.perf_counter()
 
         try:
-            if isinstance(event, InitEvent):
+            handler = self._get_event_handler(type(event))
 
-                try:
-                    self.initialise_app()
-                except Exception as e:
-                    logger.exception(self.driver.set_last_err(f"AppProcessor: Exception initialising app: {e}"))
-                    return False
+            if handler is None:
+                return False  # Event not processed
 
-            elif isinstance(event, StatusUpdateEvent):
+            return handler(event)
 
-                try:
-                    self.process_status_update(event)
-                except Exception as e:
-                    logger.exception(self.driver.set_last_err(f"AppProcessor: Exception processing status update event {event}: {e}"))
-                    return False
+        finally:
+            if debug:
+                logger.debug("AppProcessor %s finished processing event %s at %s taking %.3f seconds", self.name, type(event), 
+                    datetime.now(timezone.utc).isoformat(), time.perf_counter() - start_time)
+
+    def _get_event_handler(self, event_type: type):
+        """Looks up the handler for an event type in the dispatch table.
+            Subclasses of the event types in the table are resolved by a scan on first sight,
+            then added to the table so that later events of the same type are a single lookup.
+            : param event_type: The type of the event to process
+            : return: The bound handler method, or None if the event type is not processed
+        """
+        handler = self._dispatch.get(event_type)
 
-            elif isinstance(event, events.TimerEvent):
+        if handler is None:
+            for base_type, base_handler in self._dispatch.items():
+                if issubclass(event_type, base_type):
+                    handler = self._dispatch[event_type] = base_handler
+                    break
 
-                if event.timer_cancelled:
-                    logger.debug(f"AppProcessor {self.name} ignoring a cancelled timer event: {event}")
-                    return True
+        return handler
 
-                if event.user_callback is not None:
-                    logger.debug(f"AppProcessor {self.name} received timer event with callback: {event}")
-                    try:
-                        event.user_callback(event.user_ref)
-                    except Exception as e:
-                        logger.exception(self.driver.set_last_err(f"AppProcessor {self.name} exception in user callback for timer event {event}: {e}"))
-                        return False
+    def _on_init_event(self, event: InitEvent) -> bool:
 
-                handler_method = "process_timer_event"
+        try:
+            self.initialise_app()
+        except Exception as e:
+            logger.exception(self.driver.set_last_err(f"AppProcessor: Exception initialising app: {e}"))
+            return False
 
-                if hasattr(self.driver, handler_method) and callable(getattr(self.driver, handler_method)):
-                    try:
-                        self.performActions(getattr(self.driver, handler_method)(event))
-                    except Exception as e:
-                        logger.exception(self.driver.set_last_err(f"AppProcessor {self.name} exception in driver handler {handler_method} while processing timer event {event}: {e}"))
-                        return False
-                return True
+        return True
 
-            elif isinstance(event, events.DataEvent):
-            
-                api_msg = APIMessage()
+    def _on_status_update_event(self, event: StatusUpdateEvent) -> bool:
 
-                try:
-                    # Unpack the event's data into an API message
-                    api_msg.from_data(event.data)
-                    api_msg.add_echo_api_header()
-
-                    api, endpoint, interface_type = self.driver.get_interface(api_msg.get_from_system())
-
-                    # Validate and translate the API message to the driver's API version
-                    api_transl_msg = api.translate(api_msg.get_json_api_header())
-                    api.validate(api_transl_msg)
-
-                    # Safely resolve the driver's application name
-                    if getattr(self.driver, "app_model", None) is not None and hasattr(self.driver.app_model, "app_name"):
-                        driver_app_name = self.driver.app_model.app_name
-                    else:
-                        logger.error(self.driver.set_last_err(f"AppProcessor {self.name} driver has no app_model.app_name attribute"))
-                        driver_app_name = getattr(self.driver, "app_name", None) or type(self.driver).__name__
-
-                    # Check if the API message is not intended for this App (using from_system/to_system api header fields)
-                    if api_msg.get_to_system() != driver_app_name:
-                        logger.warning(f"AppProcessor {self.name} received API message intended for different App: {api_msg.get_to_system()} (this App: {driver_app_name}): {event}")
-                        rsp_msg = self._construct_rsp_msg(api_msg, 'error', f"Message not intended for {driver_app_name}, but for {api_msg.get_to_system()}")
-                        self.performActions(Action().set_msg_to_remote(rsp_msg), event.local_sap, event.remote_conn, event.remote_addr)
-                        return True
-
-                    # Handle debug get/set requests
-                    api_call = api_msg.get_api_call()
-                    if api_call['msg_type'] == 'req' and api_call['action_code'] in ('set', 'get') and api_call['property'] in ("debug"):
-                        rsp_msg = self._handle_debug_req(api_msg, api_call)
-                        self.performActions(Action().set_msg_to_remote(rsp_msg), event.local_sap, event.remote_conn, event.remote_addr)
-                        return True
-
-                    # If ENTITY_DRIVER interface, perform entity matching and setup appropriate handler
-                    if interface_type == InterfaceType.ENTITY_DRIVER:
-
-                        # Ask the driver if it can resolve the entity from the event based on entity configuration
-                        entity_id, entity = self._get_entity(event)
-                        # Perform entity id matching betweem the incoming message and the driver entity configuration
-                        entity_match = not (api_msg.get_entity() is None or entity_id is None or api_msg.get_entity() != entity_id)
-
-                        # If no entity match (or entity unknown), respond with an error
-                        if not entity_match:
-                            logger.warning(f"AppProcessor {self.name} received API message for unknown Entity {api_msg.get_entity()}. Check configuration!\n{event}")
-                            rsp_msg = self._construct_rsp_msg(api_msg, 'error', f"Received API message for unknown entity {driver_app_name}:{api_msg.get_entity()}. Check configuration!")
-                            self.performActions(Action().set_msg_to_remote(rsp_msg), event.local_sap, event.remote_conn, event.remote_addr)
-                            return True
-
-                        # Store the entity_id and corresponding connection in the driver's entity connection map for future use    
-                        self.driver.entity_connection_map[entity_id] = (event.remote_conn, event.remote_addr)
-
-                        handler_method = "process_" + api_msg.get_from_system() + "_entity_msg"
-                        handler_parameters = (event, api_msg.get_json_api_header(), api_msg.get_api_call(), api_msg.get_payload_data(), entity)
-
-                    else:
-
-                        handler_method = "process_" + api_msg.get_from_system() + "_msg"
-                        handler_parameters = (event, api_msg.get_json_api_header(), api_msg.get_api_call(), api_msg.get_payload_data())
-                    
-                    # Invoke the appropriate driver handler with its parameters
-                    if hasattr(self.driver, handler_method) and callable(getattr(self.driver, handler_method)):
-                        try:
-                            self.performActions(getattr(self.driver, handler_method)(*handler_parameters), 
-                                event.local_sap, event.remote_conn, event.remote_addr)
-                        except Exception as e:
-                            logger.exception(self.driver.set_last_err(f"AppProcessor {self.name} exception in driver handler {handler_method} while processing message " + \
-                                f"from {api_msg.get_from_system()}.\n{event}\nException: {e}"))
-                            return False
-                    else:
-                        logger.warning(f"AppProcessor {self.name} driver has no handler {handler_method} for messages from {api_msg.get_from_system()}.\n{event}")
-
-                except XBase as e:
-                    logger.exception(self.driver.set_last_err(f"AppProcessor {self.name} failed to process data event from Service Access Point {event.local_sap.description}: {e}"))
-                    return False
+        try:
+            self.process_status_update(event)
+        except Exception as e:
+            logger.exception(self.driver.set_last_err(f"AppProcessor: Exception processing status update event {event}: {e}"))
+            return False
 
-                return True
+        return True
 
-            elif isinstance(event, events.ConnectEvent):
+    def _on_timer_event(self, event: events.TimerEvent) -> bool:
 
-                api, endpoint, interface_type = self.driver.get_interface(event.local_sap.description)
+        if event.timer_cancelled:
+            logger.debug("AppProcessor %s ignoring a cancelled timer event: %s", self.name, event)
+            return True
 
-                # Ensure the connection is coming from a known entity for ENTITY_DRIVER interfaces
-                if interface_type == InterfaceType.ENTITY_DRIVER:
+        # Timers armed with a callback belong to the App or its endpoints (e.g. the availability report,
+        # TCPClient reconnects), and are handled by their callback only. Driver timers never have a callback
+        if event.user_callback is not None:
+            logger.debug("AppProcessor %s received timer event with callback: %s", self.name, event)
+            try:
+                event.user_callback(event.user_ref)
+            except Exception as e:
+                logger.exception(self.driver.set_last_err(f"AppProcessor {self.name} exception in user callback for timer event {event}: {e}"))
+                return False
+            return True
 
-                    entity_id, entity = self._get_entity(event)
+        handler_method = "process_timer_event"
 
-                    if entity_id is None or entity is None:
-                        logger.error(self.driver.set_last_err(f"AppProcessor {self.name} received connect event from unknown entity on {interface_type.name} interface.\n{event}"))
-                        return False
+        handler = self._get_driver_handler(handler_method)
+        if handler is not None:
+            try:
+                self.performActions(handler(event))
+            except Exception as e:
+                logger.exception(self.driver.set_last_err(f"AppProcessor {self.name} exception in driver handler {handler_method} while processing timer event {event}: {e}"))
+                return False
+        return True
 
-                    # Store the entity_id and corresponding connection in the driver's entity connection map for future use
-                    self.driver.entity_connection_map[entity_id] = (event.remote_conn, event.remote_addr)
+    def _on_data_event(self, event: events.DataEvent) -> bool:
 
-                    handler_method = "process_" + event.local_sap.description + "_entity_connected"
-                    handler_parameters = (event, entity)
+        api_msg = self._scratch_api_msg
 
-                else:
-                    handler_method = "process_" + event.local_sap.description + "_connected"
-                    handler_parameters = (event,)
+        try:
+            # Unpack the event's data into this processor's reusable API message
+            api_msg.reset(event.data)
+            api_msg.add_echo_api_header()
 
-                if hasattr(self.driver, handler_method) and callable(getattr(self.driver, handler_method)):
-                    try:
-                        self.performActions(getattr(self.driver, handler_method)(*handler_parameters),
-                            event.local_sap, event.remote_conn, event.remote_addr)
-                    except Exception as e:
-                        logger.exception(self.driver.set_last_err(f"AppProcessor {self.name} exception in driver handler {handler_method} while processing connect event {event}: {e}"))
-                        return False
+            api, endpoint, interface_type = self.driver.get_interface(api_msg.get_from_system())
+
+            # Validate and translate the API message to the driver's API version
+            api_transl_msg = api.translate(api_msg.get_json_api_header())
+            api.validate(api_transl_msg)
+
+            driver_app_name = self._driver_app_name or self._refresh_driver_snapshot()
+
+            # Check if the API message is not intended for this App (using from_system/to_system api header fields)
+            if api_msg.get_to_system() != driver_app_name:
+                logger.warning("AppProcessor %s received API message intended for different App: %s (this App: %s): %s", self.name, api_msg.get_to_system(), driver_app_name, event)
+                rsp_msg = self._construct_rsp_msg(api_msg, 'error', f"Message not intended for {driver_app_name}, but for {api_msg.get_to_system()}")
+                self.performActions(Action().set_msg_to_remote(rsp_msg), event.local_sap, event.remote_conn, event.remote_addr)
                 return True
-                
-            elif isinstance(event, events.DisconnectEvent):
-                
-                api, endpoint, interface_type = self.driver.get_interface(event.local_sap.description)
 
-                # Check if the disconnect is for an ENTITY_DRIVER interface
-                if interface_type == InterfaceType.ENTITY_DRIVER:
+            # Handle debug get/set requests
+            api_call = api_msg.get_api_call()
+            if api_call['msg_type'] == 'req' and api_call['action_code'] in ('set', 'get') and api_call.get('property') == 'debug':
+                rsp_msg = self._handle_debug_req(api_msg, api_call)
+                self.performActions(Action().set_msg_to_remote(rsp_msg), event.local_sap, event.remote_conn, event.remote_addr)
+                return True
 
-                    entity_id, entity = self._get_entity(event)
+            # If ENTITY_DRIVER interface, perform entity matching and setup appropriate handler
+            if interface_type == InterfaceType.ENTITY_DRIVER:
 
-                    if entity_id is None or entity is None:
-                        logger.error(self.driver.set_last_err(f"AppProcessor {self.name} received disconnect event from unknown entity on {interface_type.name} interface.\n{event}"))
-                        return False
+                # Ask the driver if it can resolve the entity from the event based on entity configuration
+                entity_id, entity = self._get_entity(event)
+                # Perform entity id matching betweem the incoming message and the driver entity configuration
+                entity_match = not (api_msg.get_entity() is None or entity_id is None or api_msg.get_entity() != entity_id)
 
-                    # Remove the entity connection from the driver's entity connection map
-                    if entity_id in self.driver.entity_connection_map:
-                        del self.driver.entity_connection_map[entity_id]
+                # If no entity match (or entity unknown), respond with an error
+                if not entity_match:
+                    logger.warning("AppProcessor %s received API message for unknown Entity %s. Check configuration!\n%s", self.name, api_msg.get_entity(), event)
+                    rsp_msg = self._construct_rsp_msg(api_msg, 'error', f"Received API message for unknown entity {driver_app_name}:{api_msg.get_entity()}. Check configuration!")
+                    self.performActions(Action().set_msg_to_remote(rsp_msg), event.local_sap, event.remote_conn, event.remote_addr)
+                    return True
 
-                    handler_method = "process_" + event.local_sap.description + "_entity_disconnected"
-                    handler_parameters = (event, entity)
-                    
-                else:
-                    handler_method = "process_" + event.local_sap.description + "_disconnected"
-                    handler_parameters = (event,)
+                # Store the entity_id and corresponding connection in the driver's entity connection map for future use    
+                self.driver.entity_connection_map[entity_id] = (event.remote_conn, event.remote_addr)
 
-                if hasattr(self.driver, handler_method) and callable(getattr(self.driver, handler_method)):
-                    try:
-                        self.performActions(getattr(self.driver, handler_method)(*handler_parameters),
-                            event.local_sap, event.remote_conn, event.remote_addr)
-                    except Exception as e:
-                        logger.exception(self.driver.set_last_err(f"AppProcessor {self.name} exception in driver handler {handler_method} while processing disconnect event {event}: {e}"))
-                        return False
-                return True
+                handler_method = f"process_{api_msg.get_from_system()}_entity_msg"
+                handler = self._get_driver_handler(handler_method)
+                handler_parameters = (event, api_msg.get_json_api_header(), api_msg.get_api_call(), api_msg.get_payload_data(), entity)
 
-            elif isinstance(event, events.ConfigEvent):
+            else:
+
+                handler_method = f"process_{api_msg.get_from_system()}_msg"
+                handler = self._get_driver_handler(handler_method)
+                handler_parameters = (event, api_msg.get_json_api_header(), api_msg.get_api_call(), api_msg.get_payload_data())
+                
+            # Invoke the appropriate driver handler with its parameters
+            if handler is not None:
                 try:
-                    self.process_config_event(event)
+                    self.performActions(handler(*handler_parameters), 
+                        event.local_sap, event.remote_conn, event.remote_addr)
                 except Exception as e:
-                    logger.exception(self.driver.set_last_err(f"AppProcessor: Exception processing config event {event}: {e}"))
+                    logger.exception(self.driver.set_last_err(f"AppProcessor {self.name} exception in driver handler {handler_method} while processing message " + \
+                        f"from {api_msg.get_from_system()}.\n{event}\nException: {e}"))
                     return False
-                return True
+            else:
+                logger.warning("AppProcessor %s driver has no handler %s for messages from %s.\n%s", self.name, handler_method, api_msg.get_from_system(), event)
 
-            elif isinstance(event, events.ObsEvent):
+        except XBase as e:
+            logger.exception(self.driver.set_last_err(f"AppProcessor {self.name} failed to process data event from Service Access Point {event.local_sap.description}: {e}"))
+            return False
 
-                handler_method = "process_obs_event"
+        return True
 
-                if hasattr(self.driver, handler_method) and callable(getattr(self.driver, handler_method)):
-                    try:
-                        self.performActions(getattr(self.driver, handler_method)(event))
-                    except Exception as e:
-                        logger.exception(self.driver.set_last_err(f"AppProcessor {self.name} exception in driver handler {handler_method} while processing observation event {event}: {e}"))
-                        return False
-                return True
+    def _on_connect_event(self, event: events.ConnectEvent) -> bool:
 
-            else:
-                return False  # Event not processed
+        api, endpoint, interface_type = self.driver.get_interface(event.local_sap.description)
 
-        finally:
-            end_time = time.time()
-            et = datetime.fromtimestamp(end_time, tz=timezone.utc).isoformat()
-            logger.debug(f"AppProcessor {self.name} finished processing event {type(event)} at {et} taking {(end_time-start_time):.3f} seconds")
+        # Ensure the connection is coming from a known entity for ENTITY_DRIVER interfaces
+        if interface_type == InterfaceType.ENTITY_DRIVER:
+
+            entity_id, entity = self._get_entity(event)
+
+            if entity_id is None or entity is None:
+                logger.error(self.driver.set_last_err(f"AppProcessor {self.name} received connect event from unknown entity on {interface_type.name} interface.\n{event}"))
+                return False
 
+            # Store the entity_id and corresponding connection in the driver's entity connection map for future use
+            self.driver.entity_connection_map[entity_id] = (event.remote_conn, event.remote_addr)
+
+            handler_method = f"process_{event.local_sap.description}_entity_connected"
+            handler = self._get_driver_handler(handler_method)
+            handler_parameters = (event, entity)
+
+        else:
+            handler_method = f"process_{event.local_sap.description}_connected"
+            handler = self._get_driver_handler(handler_method)
+            handler_parameters = (event,)
+
+        if handler is not None:
+            try:
+                self.performActions(handler(*handler_parameters),
+                    event.local_sap, event.remote_conn, event.remote_addr)
+            except Exception as e:
+                logger.exception(self.driver.set_last_err(f"AppProcessor {self.name} exception in driver handler {handler_method} while processing connect event {event}: {e}"))
+                return False
+        return True
+
+    def _on_disconnect_event(self, event: events.DisconnectEvent) -> bool:
+
+        api, endpoint, interface_type = self.driver.get_interface(event.local_sap.description)
+
+        # Check if the disconnect is for an ENTITY_DRIVER interface
+        if interface_type == InterfaceType.ENTITY_DRIVER:
+
+            entity_id, entity = self._get_entity(event)
+
+            if entity_id is None or entity is None:
+                logger.error(self.driver.set_last_err(f"AppProcessor {self.name} received disconnect event from unknown entity on {interface_type.name} interface.\n{event}"))
+                return False
+
+            # Remove the entity connection from the driver's entity connection map
+            if entity_id in self.driver.entity_connection_map:
+                del self.driver.entity_connection_map[entity_id]
+
+            handler_method = f"process_{event.local_sap.description}_entity_disconnected"
+            handler = self._get_driver_handler(handler_method)
+            handler_parameters = (event, entity)
+                
+        else:
+            handler_method = f"process_{event.local_sap.description}_disconnected"
+            handler = self._get_driver_handler(handler_method)
+            handler_parameters = (event,)
+
+        if handler is not None:
+            try:
+                self.performActions(handler(*handler_parameters),
+                    event.local_sap, event.remote_conn, event.remote_addr)
+            except Exception as e:
+                logger.exception(self.driver.set_last_err(f"AppProcessor {self.name} exception in driver handler {handler_method} while processing disconnect event {event}: {e}"))
+                return False
+        return True
+
+    def _on_config_event(self, event: ConfigEvent) -> bool:
+
+        try:
+            self.process_config_event(event)
+        except Exception as e:
+            logger.exception(self.driver.set_last_err(f"AppProcessor: Exception processing config event {event}: {e}"))
+            return False
+        return True
+
+    def _on_obs_event(self, event: ObsEvent) -> bool:
+
+        handler_method = "process_obs_event"
+
+        handler = self._get_driver_handler(handler_method)
+        if handler is not None:
+            try:
+                self.performActions(handler(event))
+            except Exception as e:
+                logger.exception(self.driver.set_last_err(f"AppProcessor {self.name} exception in driver handler {handler_method} while processing observation event {event}: {e}"))
+                return False
         return True
 
     def performActions(self, action: Action, local_sap=None, remote_conn=None, remote_addr=None):
@@ -349,19 +440,28 @@ class AppProcessor(Processor):
         if action is None:
             return
 
-        logger.debug(f"AppProcessor {self.name} performing actions: {action}")
+        logger.debug("AppProcessor %s performing actions: %s", self.name, action)
+
+        # Each loop below performs its actions in a single pass, collecting the actions that could not be
+        # performed into a residual list which then replaces the action's list
 
         # Perform message actions
-        for msg in action.msgs_to_remote[:]:    # Iterate over a copy [:] of the list to allow removal during iteration
+        residual = []
+        interfaces = {}     # Interfaces looked up during this call, by destination system
+        for msg in action.msgs_to_remote:
 
-            logger.debug(f"AppProcessor {self.name} performing action: send message to remote:\n{msg}")
+            logger.debug("AppProcessor %s performing action: send message to remote:\n%s", self.name, msg)
 
             if not isinstance(msg, APIMessage):
                 logger.error(self.driver.set_last_err(f"AppProcessor {self.name} failed to perform action 'send message to remote' because message is not an APIMessage instance:\n{msg}"))
+                residual.append(msg)
                 continue
 
             dest_system = msg.get_to_system()
-            api, endpoint, interface_type = self.driver.get_interface(dest_system)
+            interface = interfaces.get(dest_system)
+            if interface is None:
+                interface = interfaces[dest_system] = self.driver.get_interface(dest_system)
+            api, endpoint, interface_type = interface
 
             msg_to_send = msg
 
@@ -372,12 +472,16 @@ class AppProcessor(Processor):
                 if api_header is not None:
                     orig_version = api_header.get('api_version', api.get_api_version())
                     msg.remove_echo_api_header()
-                    api_transl_msg = api.translate(api_msg=msg.get_json_api_header(), target_version=orig_version)
 
-                    msg_to_send = APIMessage(api_msg=api_transl_msg, payload=msg.get_payload_data())
+                    # Only translate (into a new message) if the originator speaks a different API version
+                    if orig_version != msg.get_api_version():
+                        api_transl_msg = api.translate(api_msg=msg.get_json_api_header(), target_version=orig_version)
+
+                        msg_to_send = APIMessage(api_msg=api_transl_msg, payload=msg.get_payload_data())
 
             except XBase as e:
                 logger.error(self.driver.set_last_err(f"AppProcessor {self.name} failed to perform action 'send message to remote' because validate/translate of API message failed: {e} Message:\n{msg}"))
+                residual.append(msg)
                 continue
 
             # If the destination endpoint is the same as the local_sap of the originating event, send the message on the originating connection (client_socket)
@@ -385,14 +489,16 @@ class AppProcessor(Processor):
 
                 endpoint.send(msg_to_send, remote_conn)  # Send the message on the originating connection (socket)
 
-            elif interface_type in [InterfaceType.ENTITY_DRIVER]:
+            elif interface_type == InterfaceType.ENTITY_DRIVER:
                 entity_id = msg.get_entity()
 
                 if entity_id is None:
                     logger.error(self.driver.set_last_err(f"AppProcessor {self.name} failed to perform action 'send message to remote' because entity ID is not specified in message for an ENTITY interface:\n{msg}"))
+                    residual.append(msg)
                     continue
                 if entity_id not in self.driver.entity_connection_map:
                     logger.error(self.driver.set_last_err(f"AppProcessor {self.name} failed to perform action 'send message to remote' because no connection found for entity ID {entity_id} in ENTITY interface:\n{msg}"))
+                    residual.append(msg)
                     continue
                 else:
                     conn, addr = self.driver.entity_connection_map[entity_id]
@@ -400,22 +506,24 @@ class AppProcessor(Processor):
                 endpoint.send(msg_to_send, conn)         # Send the message on the entity connection (socket)
             else:
                 endpoint.send(msg_to_send)               # Send the message on the registered endpoint's default connection (socket)
-        
-            action.msgs_to_remote.remove(msg)  # Remove the msg from the list                
-        
+
+        action.msgs_to_remote = residual
+
         # Perform timer actions
-        for timer in action.timer_actions[:]:  # Iterate over a copy [:] of the list to allow removal during iteration
+        residual = []
+        for timer in action.timer_actions:
 
-            logger.debug(f"AppProcessor {self.name} performing action: set timer: {timer}")
+            logger.debug("AppProcessor %s performing action: set timer: %s", self.name, timer)
 
             if not isinstance(timer, Action.Timer):
                 logger.error(self.driver.set_last_err(f"AppProcessor {self.name} failed to perform timer action {timer} because it is not an Action.Timer instance"))
+                residual.append(timer)
                 continue
 
             timers = Timer.manager.get_timers_by_name(timer.name)
 
             for t in timers:
-                logger.debug(f"AppProcessor {self.name} cancelling existing timer: {t}")
+                logger.debug("AppProcessor %s cancelling existing timer: %s", self.name, t)
                 t.cancel()
 
             if timer.get_timer_action() != Action.Timer.TIMER_STOP:
@@ -428,68 +536,77 @@ class AppProcessor(Processor):
 
                 Timer.manager.add_timer(new_timer)
 
-                action.timer_actions.remove(timer)      # Remove the timer action from the list
-                logger.debug(f"AppProcessor {self.name} started new timer: {new_timer}")
-            
+                logger.debug("AppProcessor %s started new timer: %s", self.name, new_timer)
+            else:
+                residual.append(timer)                  # Timer stop actions are kept in the list, as before
+
+        action.timer_actions = residual
+
         # Perform connection actions
-        for conn_action in action.connection_actions[:]:  # Iterate over a copy [:] of the list to allow removal during iteration
+        residual = []
+        for conn_action in action.connection_actions:
 
-            logger.debug(f"AppProcessor {self.name} performing action: set connection: {conn_action}")
+            logger.debug("AppProcessor %s performing action: set connection: %s", self.name, conn_action)
 
-            if not isinstance(conn_action, Action.Connection):
-                logger.error(self.driver.set_last_err(f"AppProcessor {self.name} failed to perform connection action {conn_action} because it is not an Action.Connection instance"))
+            if not isinstance(conn_action, Action.Comms):
+                logger.error(self.driver.set_last_err(f"AppProcessor {self.name} failed to perform connection action {conn_action} because it is not an Action.Comms instance"))
+                residual.append(conn_action)
                 continue
 
             # Placeholder for actual connection handling logic
-            action.connection_actions.remove(conn_action)  # Remove the connection action from the list
-            logger.debug(f"AppProcessor {self.name} processed connection action: {conn_action}")
+            logger.debug("AppProcessor %s processed connection action: %s", self.name, conn_action)
+
+        action.connection_actions = residual
 
         # For each observation transition action, create an ObsEvent and enqueue it (hand it over to another processor)
-        for obs_transition in action.obs_transitions[:]:  # Iterate over a copy [:] of the list to allow removal during iteration
+        residual = []
+        for obs_transition in action.obs_transitions:
 
-            logger.debug(f"AppProcessor {self.name} performing action: observation transition: {obs_transition}")
+            logger.debug("AppProcessor %s performing action: observation transition: %s", self.name, obs_transition)
 
             if not isinstance(obs_transition, Action.Transition):
                 logger.error(self.driver.set_last_err(f"AppProcessor {self.name} failed to perform observation transition action {obs_transition} because it is not an Action.Transition instance"))
+                residual.append(obs_transition)
                 continue
 
             obs_event = ObsEvent(transition=obs_transition.get_transition(), obs=obs_transition.get_obs(), user_ref=obs_transition.get_echo_data(), timestamp=datetime.now(timezone.utc))
-            self.get_queue().put(obs_event)  # Enqueue the observation event for processing
+            # Enqueue the observation event for processing. Never block on a full event queue: this processor
+            # is one of its consumers, so waiting for a free slot could stall every processor at once
+            try:
+                self.get_queue().put(obs_event, block=False)
+            except Full:
+                logger.error(self.driver.set_last_err(f"AppProcessor {self.name} failed to perform observation transition action {obs_transition} because the event queue is full"))
+                residual.append(obs_transition)
+                continue
 
-            action.obs_transitions.remove(obs_transition)  # Remove the observation transition action from the list
-            logger.debug(f"AppProcessor {self.name} processed observation transition action: {obs_transition}")
+            logger.debug("AppProcessor %s processed observation transition action: %s", self.name, obs_transition)
+
+        action.obs_transitions = residual
 
     def _handle_debug_req(self, api_msg: APIMessage, api_call: dict) -> APIMessage:
         
         prop_name = api_call['action_code'] + '_' + api_call['property']
-        prop_value = api_call['value']
+        prop_value = api_call.get('value')
 
         status = 'success'
 
-        if prop_name in ('set_debug') and prop_value in ('on'):
+        if prop_name == 'get_debug':
 
-            self.debug = True
-            logger.setLevel(logging.DEBUG)
-            logger.info(f"AppProcessor {self.name} set debug level to ON")
-            message = f"Debug level set to ON"
+            logger.info("AppProcessor %s debug level is %s", self.name, 'ON' if self.debug else 'OFF')
+            message = f"Debug level is { 'ON' if self.debug else 'OFF' }"
 
-        elif prop_name in ('set_debug') and prop_value in ('off'):
-            
-            self.debug = False
-            logger.setLevel(logging.INFO)
-            logger.info(f"AppProcessor {self.name} set debug level to OFF")
-            message = f"Debug level set to OFF"
+        elif isinstance(prop_value, str) and (op := self._DEBUG_OPS.get((prop_name, prop_value))) is not None:
 
-        elif prop_name in ('get_debug'):
-            
-            logger.info(f"AppProcessor {self.name} debug level is { 'ON' if self.debug else 'OFF' }")
-            message = f"Debug level is { 'ON' if self.debug else 'OFF' }"
+            self.debug, level = op
+            logger.setLevel(level)
+            logger.info("AppProcessor %s set debug level to %s", self.name, 'ON' if self.debug else 'OFF')
+            message = f"Debug level set to { 'ON' if self.debug else 'OFF' }"
 
         else:
 
             status = 'error'
             message = f"Unknown property or value: {prop_name}={prop_value}"
-            logger.warning(f"AppProcessor {self.name} {message}")
+            logger.warning("AppProcessor %s %s", self.name, message)
         
         rsp_msg = APIMessage(api_msg.get_json_api_header())
         rsp_msg.switch_from_to()
@@ -166,9 +166,12 @@ class StatusUpdateEvent:
         self.update_time = None
 
     def enqueue(self, event_q:Queue):
+        self.notify_enqueued()
+        event_q.put(self)
+
+    def notify_enqueued(self):
         self.enqueue_time = time.time()
         self.current_status = StatusUpdateEvent.STATUS_ENQUEUED
-        event_q.put(self)
 
     def notify_dequeued(self):
         self.current_status = StatusUpdateEvent.STATUS_PROCESSING
@@ -1,7 +1,10 @@
+from collections import deque
 import threading
 from queue import Queue, Empty
 import time
 
+from env.ring import Ring
+
 import logging
 logger = logging.getLogger(__name__)
 
@@ -11,14 +14,32 @@ class Processor(threading.Thread):
     _single_threaded = False        # Global threading mode flag, default is free-threaded
     _running = True                 # Global running flag
 
+    batch_size = 8                  # Maximum number of events taken from a Ring per visit, see _take_events()
+
     def __init__(self, name=None, event_q=None):
 
         super().__init__(args=(name,), daemon=True) # Ensure thread exits when main program exits
 
-        self._event_q = event_q if event_q else Queue()
+        self._event_q = event_q if event_q else Ring()
+
+        # Events taken from a Ring event queue that this processor has not started yet.
+        # Idle peer processors steal from its head, see _steal_events()
+        self._local = deque()
+        self._peers = ()
+
+        # Events handed to this processor only, e.g. the App's InitEvent. They are
+        # taken before any other event and, unlike the local deque, are never stolen by peers
+        self._priority = deque()
 
-        self._event = None
-        self._event_timestamp = None
+        # Priority events for whichever processor sharing this deque is free first, see set_shared_priority()
+        self._shared_priority = deque()
+
+        # Current event and the time its processing started, published together as one
+        # tuple by the processor thread so readers always see a consistent pair
+        self._current = (None, None)
+
+        # Serialized form of the current event as (self._current snapshot, repr), see get_current_event_repr()
+        self._repr_cache = (None, None)
 
     @staticmethod
     def stop_all():
@@ -43,14 +64,78 @@ class Processor(threading.Thread):
     def put_queue(self, event_q: Queue):
         self._event_q = event_q
 
+    def set_peers(self, peers: list):
+        """ Sets the processors sharing this processor's Ring event queue, which it may steal events from.
+            : param peers: List of processors, may include this processor
+        """
+        self._peers = tuple(peer for peer in peers if peer is not self)
+
+    def set_shared_priority(self, shared_priority: deque):
+        """ Sets the deque of priority events this processor shares with its peers, e.g. App.put_priority_event().
+            They are taken after this processor's own priority events, ahead of the events waiting in the event queue.
+            : param shared_priority: Deque of priority events shared by the processors
+        """
+        self._shared_priority = shared_priority
+
+    def put_priority(self, event):
+        """ Puts an event in this processor's priority slot, to be processed by this processor
+            ahead of the events waiting in its event queue.
+            : param event: The event to process
+        """
+        self._priority.append(event)
+
+        # Wake this processor if it is sleeping on an empty ring
+        if isinstance(self._event_q, Ring):
+            self._event_q.notify()
+
     def get_queue(self) -> Queue:
         return self._event_q
 
     def get_current_event(self):
-        return self._event
+        return self._current[0]
 
     def get_current_event_processing_time(self):
-        return (time.time() - self._event_timestamp) * 1000 if self._event_timestamp else None
+        return self.get_current_event_state()[1]
+
+    def get_current_event_state(self) -> tuple:
+        """ Snapshots the current event without locking.
+            : returns: (current event, elapsed processing time in ms) or (None, None) if idle
+        """
+        event, timestamp = self._current
+        return event, (time.time() - timestamp) * 1000 if timestamp else None
+
+    def get_current_event_repr(self) -> tuple:
+        """ Snapshots the current event in a JSON-serializable form without locking.
+            The serialized form is cached until the processor moves on to its next event,
+            so repeated snapshots of a long running event do not serialize it again.
+            : returns: (serialized current event, elapsed processing time in ms) or (None, None) if idle
+        """
+        current = self._current
+        event, timestamp = current
+
+        if event is None:
+            return None, None
+
+        # Compare against the published tuple rather than the event, as events such as the
+        # status update event are reused and may be processed again as the same object
+        cached_current, ev_repr = self._repr_cache
+        if cached_current is not current:
+            # Prefer a structured representation if the event exposes it,
+            # otherwise fall back to a short string.
+            try:
+                to_dict = getattr(event, "to_dict", None)
+                if callable(to_dict):
+                    ev_repr = to_dict()
+                else:
+                    # Use a concise string representation to avoid embedding
+                    # large objects or types that aren't JSON serializable.
+                    ev_repr = str(event)
+            except Exception:
+                ev_repr = repr(event)
+
+            self._repr_cache = (current, ev_repr)
+
+        return ev_repr, (time.time() - timestamp) * 1000 if timestamp else None
 
     def run(self):
         """ Thread run method to process events from the queue 
@@ -60,7 +145,7 @@ class Processor(threading.Thread):
         """
         logger.debug(f"Processor {self.name} started running")
 
-        while Processor._running:
+        while True:  # Exit through the stop check below, which also hands back single-threaded mode
 
             acquired_mutex = False
 
@@ -79,26 +164,116 @@ class Processor(threading.Thread):
                 break
 
             try:
-                self._event = self._event_q.get(timeout=1)  # Wait for an event for up to 1 second
-                self._event_timestamp = time.time()
+                # Wait for an event for up to 1 second, then take the batch of events that are ready
+                for event in self._get_events(timeout=1):
+                    self._current = (event, time.time())
 
-                try:
-                    self.process_event(self._event)
-                finally:
-                    self._event_q.task_done()
+                    try:
+                        self.process_event(event)
+                    except Exception as e:
+                        logger.exception(f"Processor: Exception occurred while processing event {event} in processor {self.name}: {e}")
+                    finally:
+                        self._event_q.task_done()
 
             except Empty:
                 pass
             except Exception as e:
-                logger.exception(f"Processor: Exception occurred while processing event {self._event} in processor {self.name}: {e}")
+                logger.exception(f"Processor: Exception occurred while getting events in processor {self.name}: {e}")
             finally:
                 if acquired_mutex:
                     Processor._mutex.release()
                 
-                self._event = None
-                self._event_timestamp = None
-
-        self.join()  # Wait for the thread to finish
+                self._current = (None, None)
+                self._repr_cache = (None, None)
+
+    def _get_events(self, timeout: float) -> list:
+        """ Gets the next event to process, waiting for up to timeout seconds for one to arrive.
+            Falls back to a plain get() for a queue.Queue.
+            : param timeout: Maximum number of seconds to wait for an event
+            : returns: List holding the next event, raises queue.Empty if none arrived within the timeout
+        """
+        event_q = self._event_q
+        if not isinstance(event_q, Ring):
+            try:
+                return [self._priority.popleft()]
+            except IndexError:
+                pass
+            try:
+                return [self._shared_priority.popleft()]
+            except IndexError:
+                return [event_q.get(timeout=timeout)]
+
+        events = self._take_events()
+        if not events and not event_q.is_closed():
+            # Nothing to do, sleep until an event is put on the ring or a peer has events to steal
+            event_q.wait(timeout, ready=self._has_events)
+            events = self._take_events()
+
+        if not events:
+            raise Empty
+        return events
+
+    def _take_events(self) -> list:
+        """ Takes the next event without waiting, from (in order of preference)
+            this processor's priority slot, the shared priority deque, its local deque, a batch of up to batch_size events from the ring
+            (keeping the surplus on the local deque), or the head of a peer's local deque.
+            : returns: List holding the next event, or an empty list if there is none
+        """
+        try:
+            return [self._priority.popleft()]
+        except IndexError:
+            pass
+
+        try:
+            return [self._shared_priority.popleft()]
+        except IndexError:
+            pass
+
+        local = self._local
+        try:
+            return [local.popleft()]
+        except IndexError:
+            pass
+
+        try:
+            batch = self._event_q.get_many(self.batch_size, block=False)
+        except Empty:
+            pass
+        else:
+            if len(batch) > 1:
+                local.extend(batch[1:])
+                self._event_q.notify()  # Wake idle peers so they can steal from the surplus
+            return batch[:1]
+
+        return self._steal_events()
+
+    def _steal_events(self) -> list:
+        """ Steals half the events (at least one) from the head of the first peer with events
+            waiting on its local deque. The first stolen event is returned, the others are kept
+            on this processor's local deque, so a burst spreads over the processors in a few steals.
+            Events are taken oldest first, as the owner would, so events are still started in queue order.
+            : returns: List holding the next stolen event, or an empty list if there is none
+        """
+        for peer in self._peers:
+            victim = peer._local
+            stolen = []
+            try:
+                for _ in range(max(1, len(victim) // 2)):
+                    stolen.append(victim.popleft())
+            except IndexError:
+                pass    # The victim's owner (or another thief) got there first
+
+            if stolen:
+                if len(stolen) > 1:
+                    self._local.extend(stolen[1:])
+                return stolen[:1]
+        return []
+
+    def _has_events(self) -> bool:
+        """ Checks whether this processor has events in its priority slot or the shared priority deque,
+            or it or any of its peers has events waiting on a local deque.
+        """
+        return bool(self._priority) or bool(self._shared_priority) or bool(self._local) or any(peer._local for peer in self._peers)
 
     def process_event(self, event) -> bool:
         """ Processes an event from the queue.
@@ -139,17 +314,16 @@ if __name__ == "__main__":
 
     logger = logging.getLogger(__name__)
 
-    q = Queue()
+    q = Ring()
 
     test1 = TestProcessor(1, event_q=q)
     test2 = TestProcessor(2, event_q=q)
     test3 = TestProcessor(3, event_q=q)
     test4 = TestProcessor(4, event_q=q)
 
-    test1.start()
-    test2.start()
-    test3.start()
-    test4.start()
+    for test in (test1, test2, test3, test4):
+        test.set_peers([test1, test2, test3, test4])
+        test.start()
 
     for i in range(400):
         q.put(i)
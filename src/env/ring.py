@@ -0,0 +1,251 @@
+from collections import deque
+from queue import Empty, Full
+import threading
+import time
+
+import logging
+logger = logging.getLogger(__name__)
+
+class Ring:
+    """ Multi-producer / multi-consumer event ring used as the application event bus.
+        Drop-in replacement for the subset of queue.Queue used by App, Processor, TCPServer and Timer.
+        Like queue.Queue() it is unbounded by default, so internal producers such as the timer manager
+        and the TCP servers never block on it.
+
+        Items are held in a collections.deque, whose append() and popleft() are atomic,
+        so producers and consumers never take a shared mutex to move an event.
+        A threading.Event is only used to wake idle consumers (or blocked producers),
+        it is set by a producer writing to an empty ring and cleared by a consumer that
+        finds the ring drained.
+    """
+
+    def __init__(self, capacity: int = None):
+        """ Initialises the ring.
+            : param capacity: Maximum number of events held in the ring, or None for an unbounded ring.
+                The capacity is checked without a lock, so concurrent producers may overshoot it by up to
+                one event each. It bounds memory use, it is not an exact limit
+        """
+        if capacity is not None and capacity <= 0:
+            raise ValueError(f"Ring capacity must be positive, got {capacity}")
+
+        self._capacity = capacity
+        self._items = deque()
+
+        self._not_empty = threading.Event()     # Set while the ring (probably) holds events
+        self._not_full = threading.Event()      # Set while the ring (probably) has free slots
+        self._not_full.set()
+
+        self._closed = False                    # Set by close(), consumers no longer wait for events
+
+    def get_capacity(self) -> int:
+        """ Returns the capacity of the ring, or None if it is unbounded. """
+        return self._capacity
+
+    def put(self, item, block: bool = True, timeout: float = None):
+        """ Puts an event into the ring.
+            : param item: The event to put
+            : param block: If True, wait for a free slot when the ring is full, else raise queue.Full
+            : param timeout: Maximum number of seconds to wait for a free slot (None waits forever)
+        """
+        if self._capacity is not None and len(self._items) >= self._capacity:
+            self._wait_not_full(block, timeout)
+
+        self._items.append(item)
+
+        # Wake consumers waiting on an empty ring
+        if not self._not_empty.is_set():
+            self._not_empty.set()
+
+    def put_nowait(self, item):
+        self.put(item, block=False)
+
+    def put_many(self, items):
+        """ Puts a burst of events into the ring with a single wake up of the consumers.
+            Never blocks, raises queue.Full if the burst does not fit in the ring.
+            : param items: Sequence of events to put, in order
+        """
+        if self._capacity is not None and len(self._items) + len(items) > self._capacity:
+            raise Full
+
+        self._items.extend(items)
+
+        if items and not self._not_empty.is_set():
+            self._not_empty.set()
+
+    def get(self, block: bool = True, timeout: float = None):
+        """ Removes and returns the oldest event from the ring.
+            : param block: If True, wait for an event when the ring is empty, else raise queue.Empty
+            : param timeout: Maximum number of seconds to wait for an event (None waits forever)
+            : returns: The oldest event in the ring
+        """
+        deadline = None
+
+        while True:
+            try:
+                item = self._items.popleft()
+            except IndexError:
+                pass
+            else:
+                # Wake producers waiting on a full ring
+                if not self._not_full.is_set():
+                    self._not_full.set()
+                return item
+
+            if not block or self._closed:
+                raise Empty
+
+            if timeout is not None:
+                if deadline is None:
+                    deadline = time.monotonic() + timeout
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise Empty
+            else:
+                remaining = None
+
+            # Clear before re-checking, so an event put after the failed popleft() is not missed
+            self._not_empty.clear()
+            if self._items or self._closed:
+                continue
+
+            self._not_empty.wait(remaining)
+
+    def get_nowait(self):
+        return self.get(block=False)
+
+    def get_many(self, max_items: int = 16, block: bool = True, timeout: float = None) -> list:
+        """ Removes and returns up to max_items of the oldest events from the ring.
+            Waits (as per get) for the first event only, then takes whatever else is ready.
+            : param max_items: Maximum number of events to return
+            : param block: If True, wait for an event when the ring is empty, else raise queue.Empty
+            : param timeout: Maximum number of seconds to wait for an event (None waits forever)
+            : returns: List of between 1 and max_items events, oldest first
+        """
+        batch = [self.get(block, timeout)]
+
+        popleft = self._items.popleft
+        try:
+            while len(batch) < max_items:
+                batch.append(popleft())
+        except IndexError:
+            pass
+
+        if not self._not_full.is_set():
+            self._not_full.set()
+
+        return batch
+
+    def wait(self, timeout: float = None, ready=None) -> bool:
+        """ Waits until the ring may hold events, or notify() or close() is called.
+            The wake up is armed before the ring (and ready) is checked, so an event put
+            or a notify() that races with the check is never missed.
+            : param timeout: Maximum number of seconds to wait (None waits forever)
+            : param ready: Optional callable, returns True if the caller has other work and should not wait
+            : returns: True if woken up, False if the timeout expired
+        """
+        self._not_empty.clear()
+        if self._items or self._closed or (ready is not None and ready()):
+            return True
+        return self._not_empty.wait(timeout)
+
+    def notify(self):
+        """ Wakes consumers sleeping in get() or wait() without putting an event,
+            e.g. when a consumer has set events aside that its peers may take over.
+        """
+        if not self._not_empty.is_set():
+            self._not_empty.set()
+
+    def task_done(self):
+        """ Provided for queue.Queue compatibility. The ring does not track unfinished tasks.
+        """
+        pass
+
+    def qsize(self) -> int:
+        """ Returns the number of events in the ring. Reads the deque length without locking,
+            so it is cheap enough for status snapshots but may be stale by the time it is used.
+        """
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def full(self) -> bool:
+        return self._capacity is not None and len(self._items) >= self._capacity
+
+    def clear(self):
+        """ Discards all events in the ring. deque.clear() is atomic, so this is safe to call
+            while producers or consumers are still using the ring (e.g. during shutdown).
+        """
+        self._items.clear()
+        self._not_full.set()
+
+    def close(self):
+        """ Closes the ring for shutdown. Consumers waiting on an empty ring wake up and
+            get queue.Empty straight away, instead of waiting out their timeout.
+            Events already in the ring (or put later) can still be taken.
+        """
+        self._closed = True
+        self._not_empty.set()
+        self._not_full.set()
+
+    def is_closed(self) -> bool:
+        return self._closed
+
+    def _wait_not_full(self, block: bool, timeout: float):
+        """ Waits until the ring has a free slot.
+            : param block: If False, raise queue.Full immediately
+            : param timeout: Maximum number of seconds to wait (None waits forever)
+        """
+        if not block:
+            raise Full
+
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        while len(self._items) >= self._capacity:
+
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise Full
+            else:
+                remaining = None
+
+            # Clear before re-checking, so a slot freed after the length check is not missed
+            self._not_full.clear()
+            if len(self._items) < self._capacity:
+                break
+
+            self._not_full.wait(remaining)
+
+if __name__ == "__main__":
+
+    # Configure logging
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format='%(asctime)s %(levelname)s: %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+
+    ring = Ring(capacity=1 << 10)
+    received = []
+
+    def consume():
+        while True:
+            try:
+                event = ring.get(timeout=1)
+            except Empty:
+                break
+            received.append(event)
+
+    consumers = [threading.Thread(target=consume) for _ in range(4)]
+    for consumer in consumers:
+        consumer.start()
+
+    start = time.perf_counter()
+    for i in range(100000):
+        ring.put(i)
+
+    for consumer in consumers:
+        consumer.join()
+
+    logger.info(f"Ring passed {len(received)} events in {time.perf_counter() - start - 1:.3f} s, all received: {sorted(received) == list(range(100000))}")
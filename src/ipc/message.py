@@ -7,6 +7,12 @@ import struct
 import datetime
 import pytest
 
+try:
+    import orjson  # Optional, faster JSON decoding of message headers
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from util.util import find_json_object_end
 from util.xbase import XStreamUnableToExtract, XStreamUnableToEncode
 
@@ -111,7 +117,15 @@ class AppMessage(Message):
     def _json_decode(self, json_bytes, encoding):
         """
         Decodes a JSON byte array into a Python object.
+        Uses orjson when it is installed and the encoding is UTF-8, falling back to the
+        standard library for anything orjson rejects (e.g. NaN), so the result is the same either way.
         """
+        if HAS_ORJSON and encoding.lower() in ('utf-8', 'utf8'):
+            try:
+                return orjson.loads(json_bytes)
+            except orjson.JSONDecodeError:
+                pass
+
         json_str = json_bytes.decode(encoding)
         decoder = json.JSONDecoder()
         obj, index = decoder.raw_decode(json_str)
@@ -551,6 +565,19 @@ class APIMessage(AppMessage):
         offset += self.json_api_header_length + self.payload_length
         return offset
 
+    def reset(self, data):
+        """
+        Re-initialises this API message in place from a byte array, so a parser can reuse one instance
+        for every message it receives. The JSON headers are decoded into new dictionaries, so dictionaries
+        handed out for an earlier message (e.g. to a driver) are left untouched.
+        Returns the offset of the first byte in data that does not form part of this message.
+        """
+        # Drop the previous message's headers first, so a failed decode does not leave them behind
+        self.json_header_dict = None
+        self.json_api_header_dict = None
+
+        return self.from_data(data)
+
     def to_data(self):
         """
         Pack this API message instance into its data stream representation.
@@ -685,6 +712,42 @@ def test_api_message_with_echo_data():
     assert isinstance(api_echo_msg.get_echo_data(), dict)
     assert api_echo_msg.get_echo_data() == {"request_id": "12345", "note": "This is a test echo"}
 
+def test_api_message_reset():
+    api_msg = APIMessage()
+    api_msg.set_json_api_header(
+        api_version="1.0",
+        dt=datetime.datetime.now(datetime.timezone.utc),
+        from_system="cam",
+        to_system="dig",
+        api_call={"action": "get", "property": "frequency"}
+    )
+    first = api_msg.to_data()
+    api_msg.set_to("sdp")
+    second = api_msg.to_data()
+
+    # Reuse one instance for consecutive messages
+    scratch = APIMessage()
+    scratch.reset(first)
+    first_header = scratch.get_json_api_header()
+    assert scratch.get_to_system() == "dig"
+
+    scratch.reset(second)
+    assert scratch.get_to_system() == "sdp"
+    assert first_header["to"] == "dig"   # Header handed out for the first message is untouched
+
+    # A failed decode does not leave the previous message's header behind
+    with pytest.raises(XStreamUnableToExtract):
+        scratch.reset(b'garbage')
+    assert scratch.get_json_api_header() is None
+
+def test_json_decode_matches_stdlib():
+    app_msg = AppMessage()
+    assert app_msg._json_decode('{"a": [1, 2.5], "b": "Wörld"}'.encode('utf-8'), 'utf-8') == {"a": [1, 2.5], "b": "Wörld"}
+
+    # NaN is not valid JSON for orjson, but the standard library accepts it
+    value = app_msg._json_decode(b'{"gain": NaN}', 'utf-8')["gain"]
+    assert value != value
+
 
 if __name__ == "__main__":
 
@@ -0,0 +1,125 @@
+# tests/test_ring.py
+
+import threading
+from queue import Empty, Full
+
+import pytest
+
+from env.ring import Ring
+
+def test_fifo_order():
+    ring = Ring(capacity=8)
+    for i in range(5):
+        ring.put(i)
+
+    assert ring.qsize() == 5
+    assert [ring.get_nowait() for _ in range(5)] == list(range(5))
+    assert ring.empty()
+
+def test_unbounded_by_default():
+    ring = Ring()
+    for i in range(1 << 15):
+        ring.put_nowait(i)
+
+    assert ring.get_capacity() is None
+    assert not ring.full()
+    assert ring.qsize() == 1 << 15
+
+def test_get_timeout_raises_empty():
+    ring = Ring(capacity=8)
+
+    with pytest.raises(Empty):
+        ring.get(timeout=0.05)
+
+    with pytest.raises(Empty):
+        ring.get_nowait()
+
+def test_put_on_full_ring():
+    ring = Ring(capacity=2)
+    ring.put("a")
+    ring.put("b")
+
+    assert ring.full()
+    with pytest.raises(Full):
+        ring.put_nowait("c")
+
+    ring.get()
+    ring.put_nowait("c")
+    assert [ring.get(), ring.get()] == ["b", "c"]
+
+def test_blocked_consumer_is_woken():
+    ring = Ring(capacity=8)
+    received = []
+
+    consumer = threading.Thread(target=lambda: received.append(ring.get(timeout=5)))
+    consumer.start()
+    ring.put("event")
+    consumer.join()
+
+    assert received == ["event"]
+
+def test_multiple_producers_and_consumers():
+    ring = Ring(capacity=64)
+    received = []
+
+    def produce(base):
+        for i in range(1000):
+            ring.put(base + i)
+
+    def consume():
+        while True:
+            try:
+                received.append(ring.get(timeout=0.5))
+            except Empty:
+                break
+
+    threads = [threading.Thread(target=produce, args=(n * 1000,)) for n in range(4)]
+    threads += [threading.Thread(target=consume) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(received) == list(range(4000))
+
+def test_put_many_and_get_many():
+    ring = Ring(capacity=8)
+    ring.put_many(list(range(6)))
+
+    assert ring.get_many(max_items=4) == [0, 1, 2, 3]
+    assert ring.get_many(max_items=4) == [4, 5]
+
+    with pytest.raises(Full):
+        ring.put_many(list(range(9)))
+
+def test_close_wakes_blocked_consumer():
+    ring = Ring(capacity=8)
+    raised = []
+
+    def consume():
+        try:
+            ring.get(timeout=5)
+        except Empty:
+            raised.append(True)
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    ring.close()
+    consumer.join(timeout=1)
+
+    assert not consumer.is_alive()
+    assert raised == [True]
+
+def test_wait_wakes_on_notify():
+    ring = Ring(capacity=8)
+    woken = []
+
+    waiter = threading.Thread(target=lambda: woken.append(ring.wait(timeout=5)))
+    waiter.start()
+    while not waiter.is_alive():
+        pass
+    ring.notify()
+    waiter.join(timeout=1)
+
+    assert woken == [True]
+    assert ring.wait(timeout=0, ready=lambda: True)
@@ -79,6 +79,7 @@ class TimerManager:
 
     def __init__(self):
         self.heap = []  # (expire_time, Timer)
+        self.timers_by_name = {}  # name -> [Timer], the timers in the heap indexed by name
         self.running = False
         self.lock = threading.Lock()
         self.thread = threading.Thread(target=self._run, daemon=True)
@@ -86,6 +87,7 @@ class TimerManager:
     def add_timer(self, timer: Timer):
         with self.lock:
             heapq.heappush(self.heap, (timer.expiry_time, timer))
+            self.timers_by_name.setdefault(timer.name, []).append(timer)
 
         logger.debug(f"TimerManager added timer {timer.name} to its heap.")
 
@@ -98,8 +100,7 @@ class TimerManager:
 
     def get_timers_by_name(self, name: str) -> list[Timer]:
         with self.lock:
-            return [t for _, t in self.heap if t.name == name]
-        return []   
+            return list(self.timers_by_name.get(name, ()))
 
     def get_timers_by_keyword(self, keyword: str) -> list[Timer]:
         """ Get all timers with a name containing the given keyword. """
@@ -116,6 +117,12 @@ class TimerManager:
             self.heap = [(et, t) for et, t in self.heap if t.id != timer.id]
             heapq.heapify(self.heap)
 
+            timers = self.timers_by_name.get(timer.name)
+            if timers is not None:
+                timers[:] = [t for t in timers if t.id != timer.id]
+                if not timers:
+                    del self.timers_by_name[timer.name]
+
         logger.debug(f"TimerManager removed timer {timer.name} from its heap.")
 
     def start(self):
@@ -129,6 +136,16 @@ class TimerManager:
         self.running = False
         self.thread.join()
 
+    def _unindex_timer(self, timer: Timer):
+        """ Removes one entry for a timer popped from the heap from the name index.
+            Must be called with the lock held.
+        """
+        timers = self.timers_by_name.get(timer.name)
+        if timers is not None:
+            timers.remove(timer)
+            if not timers:
+                del self.timers_by_name[timer.name]
+
     def _run(self):
         while self.running:
             with self.lock:
@@ -140,6 +157,7 @@ class TimerManager:
                     if timer.is_active():
                         if timer.is_expired():
                             heapq.heappop(self.heap)
+                            self._unindex_timer(timer)
                             timer.queue()
                             logger.debug(f"TimerManager queued event for expired timer {timer.name}.")
                             continue
@@ -147,6 +165,7 @@ class TimerManager:
                             next_wake = expire_time - time.monotonic()
                     else:
                         heapq.heappop(self.heap)
+                        self._unindex_timer(timer)
                         logger.debug(f"TimerManager removed inactive timer {timer.name} from its heap.")
                         continue
 